@@ -3,59 +3,104 @@ MySQL Database Configuration
 Generated: 2026-01-05 10:55:40 UTC
 """
 
-import mysql.connector
-from mysql.connector import Error
+import os
+import asyncio
 
-# Database Configuration
+from dotenv import load_dotenv
+from redis.asyncio import Redis
+from sqlalchemy import text
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+load_dotenv()
+
+# Database Configuration (read from the environment / .env file)
 DB_CONFIG = {
-    'host': 'localhost',
-    'user': 'root',
-    'password': 'Lokesh@24',
-    'database': 'vehicle_challan_system'
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': int(os.getenv('DB_PORT', '3306')),
+    'user': os.getenv('DB_USER', 'root'),
+    'password': os.getenv('DB_PASSWORD', ''),
+    'database': os.getenv('DB_NAME', 'vehicle_challan_system')
 }
 
-def get_db_connection():
+# Connection pool settings
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+
+# Async SQLAlchemy engine (aiomysql driver) used by the CRUD layer
+DATABASE_URL = URL.create(
+    "mysql+aiomysql",
+    username=DB_CONFIG['user'],
+    password=DB_CONFIG['password'],
+    host=DB_CONFIG['host'],
+    port=DB_CONFIG['port'],
+    database=DB_CONFIG['database']
+)
+
+# A single process-wide pooled engine: requests borrow warm connections
+# instead of paying a TCP + auth handshake each time
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE
+)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+# Redis (short-lived caches such as dashboard statistics). The client keeps
+# its own connection pool and connects lazily on first use.
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+redis_client = Redis.from_url(REDIS_URL, decode_responses=True)
+
+
+async def get_db():
     """
-    Establish and return a MySQL database connection
-    
-    Returns:
-        mysql.connector.MySQLConnection: Database connection object
-        
-    Raises:
-        Error: If connection fails
+    FastAPI dependency providing a database session per request
+
+    The request is one transaction: CRUD functions only flush, and the
+    session is committed here once the endpoint returns (rolled back if it
+    raises).
+
+    Yields:
+        AsyncSession: Session bound to the pooled engine, closed when the
+        request finishes
     """
+    session = AsyncSessionLocal()
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
-        if connection.is_connected():
-            db_info = connection.get_server_info()
-            print(f"Successfully connected to MySQL Server version {db_info}")
-            return connection
-    except Error as err:
-        if err.errno == 2003:
-            print("Error: Unable to connect to MySQL Server. Make sure the server is running.")
-        elif err.errno == 1045:
-            print("Error: Invalid username or password.")
-        elif err.errno == 1049:
-            print("Error: Database does not exist.")
-        else:
-            print(f"Error: {err}")
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
         raise
+    finally:
+        await session.close()
+
 
-def close_db_connection(connection):
+async def get_redis():
     """
-    Close the MySQL database connection
-    
-    Args:
-        connection: MySQL database connection object
+    FastAPI dependency providing the shared Redis client
+
+    Returns:
+        Redis: Process-wide async Redis client
     """
-    if connection and connection.is_connected():
-        connection.close()
-        print("MySQL connection is closed")
+    return redis_client
+
+
+async def _check_connection():
+    """Check that a pooled connection to the MySQL server can be opened"""
+    try:
+        async with engine.connect() as connection:
+            result = await connection.execute(text("SELECT VERSION()"))
+            print(f"Successfully connected to MySQL Server version {result.scalar()}")
+    finally:
+        await engine.dispose()
+
 
 if __name__ == "__main__":
     # Test database connection
     try:
-        conn = get_db_connection()
-        close_db_connection(conn)
-    except Error as e:
+        asyncio.run(_check_connection())
+    except Exception as e:
         print(f"Connection test failed: {e}")
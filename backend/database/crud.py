@@ -1,13 +1,29 @@
 """
 CRUD operations for the vehicle challan system.
 Handles database operations for vehicles, violation types, and challans.
+All operations are coroutines that run against an AsyncSession.
+
+Write operations only flush; the caller owns the transaction and commits
+once per request (see config.get_db), so several writes commit atomically.
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+import json
+import re
+import threading
+
+from cachetools import TTLCache
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import (
+    select, insert, update, exists, func, case, and_, inspect, lambda_stmt, literal, text,
+    Table, MetaData, Column, Integer, String, event
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert, match
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, selectinload, make_transient_to_detached
 from datetime import datetime, timedelta
-from typing import List, Optional
-from models import Vehicle, ViolationType, Challan, User
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
+from models import Vehicle, ViolationType, Challan, ChallanStatus, ChallanCounter, User
 from schemas import (
     VehicleCreate, VehicleUpdate,
     ViolationTypeCreate, ViolationTypeUpdate,
@@ -15,12 +31,87 @@ from schemas import (
 )
 
 
+# Columns hydrated by the list endpoints; list views only need these, so the
+# remaining columns are neither fetched nor lazily loaded. The challan foreign
+# keys are kept so its relationships can be eager-loaded by primary key.
+_VEHICLE_LIST_COLUMNS = (
+    Vehicle.id, Vehicle.registration_number, Vehicle.owner_name
+)
+_CHALLAN_LIST_COLUMNS = (
+    Challan.id, Challan.challan_number, Challan.status,
+    Challan.issue_date, Challan.fine_amount,
+    Challan.vehicle_id, Challan.violation_type_id
+)
+
+# Eager-load challan relationships with one extra "WHERE id IN (...)" query
+# each, rather than one lazy SELECT per row
+_CHALLAN_LIST_OPTIONS = (
+    load_only(*_CHALLAN_LIST_COLUMNS, raiseload=True),
+    selectinload(Challan.vehicle),
+    selectinload(Challan.violation_type),
+)
+
+
+# Queries shaped like (a prefix of) a registration number, e.g. "MH12" or "MH-12-AB"
+_PLATE_PREFIX_RE = re.compile(r'^(?=.*\d)[A-Za-z0-9-]+$')
+
+# Characters with special meaning in MySQL boolean-mode full-text search
+_FULLTEXT_OPERATOR_RE = re.compile(r'[-+<>()~*"@]')
+
+# Redis key and TTL (seconds) for the cached dashboard statistics. Seconds-old
+# figures are fine for the dashboard, which every officer polls.
+DASHBOARD_CACHE_KEY = 'dash:v1'
+DASHBOARD_CACHE_TTL = 5
+
+# Per-connection staging table for bulk vehicle imports. It carries no unique
+# indexes, so rows land without index maintenance and the real table's
+# constraints are checked in one INSERT ... SELECT pass. MEMORY tables cannot
+# hold TEXT, hence the VARCHAR address.
+_vehicle_stage = Table(
+    'vehicle_stage', MetaData(),
+    Column('registration_number', String(20), nullable=False),
+    Column('vehicle_type', String(50), nullable=False),
+    Column('owner_name', String(255), nullable=False),
+    Column('owner_contact', String(20), nullable=False),
+    Column('owner_email', String(255)),
+    Column('owner_address', String(1024)),
+    Column('chassis_number', String(50), nullable=False),
+    Column('engine_number', String(50), nullable=False),
+    Column('manufacturing_year', Integer),
+    Column('color', String(50)),
+    Column('fuel_type', String(50)),
+    prefixes=['TEMPORARY'],
+    mysql_engine='MEMORY'
+)
+_VEHICLE_IMPORT_COLUMNS = tuple(column.name for column in _vehicle_stage.columns)
+
+# Key in AsyncSession.info for the session (i.e. request) scoped
+# registration number -> Vehicle lookup cache
+_VEHICLE_BY_REG_KEY = 'vehicle_by_registration'
+
+
+async def _ensure_fully_loaded(db: AsyncSession, instance) -> None:
+    """
+    Load any deferred columns of an identity-map hit.
+    
+    Objects first loaded by a list query only carry the list columns
+    (load_only), so a later point lookup completes them in one query.
+    """
+    state = inspect(instance)
+    unloaded = state.unloaded.intersection(state.mapper.column_attrs.keys())
+    if unloaded:
+        await db.refresh(instance, attribute_names=list(unloaded))
+
+
 # ==================== VEHICLE CRUD OPERATIONS ====================
 
-def get_vehicle(db: Session, vehicle_id: int) -> Optional[Vehicle]:
+async def get_vehicle(db: AsyncSession, vehicle_id: int) -> Optional[Vehicle]:
     """
     Retrieve a vehicle by ID.
     
+    Uses the session identity map, so repeated lookups of the same vehicle
+    within a request issue no SQL.
+    
     Args:
         db: Database session
         vehicle_id: ID of the vehicle
@@ -28,13 +119,21 @@ def get_vehicle(db: Session, vehicle_id: int) -> Optional[Vehicle]:
     Returns:
         Vehicle object or None if not found
     """
-    return db.query(Vehicle).filter(Vehicle.id == vehicle_id).first()
+    db_vehicle = await db.get(Vehicle, vehicle_id)
+    
+    if db_vehicle:
+        await _ensure_fully_loaded(db, db_vehicle)
+    
+    return db_vehicle
 
 
-def get_vehicle_by_registration(db: Session, registration_number: str) -> Optional[Vehicle]:
+async def get_vehicle_by_registration(db: AsyncSession, registration_number: str) -> Optional[Vehicle]:
     """
     Retrieve a vehicle by registration number.
     
+    Found vehicles are remembered for the lifetime of the session, so
+    repeated lookups within a request issue no SQL.
+    
     Args:
         db: Database session
         registration_number: Vehicle registration number
@@ -42,13 +141,28 @@ def get_vehicle_by_registration(db: Session, registration_number: str) -> Option
     Returns:
         Vehicle object or None if not found
     """
-    return db.query(Vehicle).filter(
-        Vehicle.registration_number == registration_number
-    ).first()
+    by_registration = db.info.setdefault(_VEHICLE_BY_REG_KEY, {})
+    
+    db_vehicle = by_registration.get(registration_number)
+    if db_vehicle:
+        return db_vehicle
+    
+    # Hot fixed-shape lookup: lambda_stmt() caches the constructed and
+    # compiled statement per call site and only swaps in the closure values
+    # as bound parameters on later calls
+    result = await db.execute(lambda_stmt(
+        lambda: select(Vehicle).where(Vehicle.registration_number == registration_number)
+    ))
+    db_vehicle = result.scalar_one_or_none()
+    
+    if db_vehicle:
+        by_registration[registration_number] = db_vehicle
+    
+    return db_vehicle
 
 
-def get_vehicles(
-    db: Session,
+async def get_vehicles(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     owner_id: Optional[int] = None,
@@ -67,18 +181,19 @@ def get_vehicles(
     Returns:
         List of Vehicle objects
     """
-    query = db.query(Vehicle)
+    stmt = select(Vehicle).options(load_only(*_VEHICLE_LIST_COLUMNS, raiseload=True))
     
     if owner_id:
-        query = query.filter(Vehicle.owner_id == owner_id)
+        stmt = stmt.where(Vehicle.owner_id == owner_id)
     
     if status:
-        query = query.filter(Vehicle.status == status)
+        stmt = stmt.where(Vehicle.status == status)
     
-    return query.offset(skip).limit(limit).all()
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    return result.scalars().all()
 
 
-def create_vehicle(db: Session, vehicle: VehicleCreate, owner_id: int) -> Vehicle:
+async def create_vehicle(db: AsyncSession, vehicle: VehicleCreate, owner_id: int) -> Vehicle:
     """
     Create a new vehicle record.
     
@@ -102,13 +217,13 @@ def create_vehicle(db: Session, vehicle: VehicleCreate, owner_id: int) -> Vehicl
         created_at=datetime.utcnow()
     )
     db.add(db_vehicle)
-    db.commit()
-    db.refresh(db_vehicle)
+    await db.flush()
+    await db.refresh(db_vehicle)
     return db_vehicle
 
 
-def update_vehicle(
-    db: Session,
+async def update_vehicle(
+    db: AsyncSession,
     vehicle_id: int,
     vehicle_update: VehicleUpdate
 ) -> Optional[Vehicle]:
@@ -123,7 +238,7 @@ def update_vehicle(
     Returns:
         Updated Vehicle object or None if not found
     """
-    db_vehicle = db.query(Vehicle).filter(Vehicle.id == vehicle_id).first()
+    db_vehicle = await get_vehicle(db, vehicle_id)
     
     if not db_vehicle:
         return None
@@ -134,12 +249,34 @@ def update_vehicle(
     for field, value in update_data.items():
         setattr(db_vehicle, field, value)
     
-    db.commit()
-    db.refresh(db_vehicle)
+    db.info.pop(_VEHICLE_BY_REG_KEY, None)
+    await db.flush()
+    await db.refresh(db_vehicle)
     return db_vehicle
 
 
-def delete_vehicle(db: Session, vehicle_id: int) -> bool:
+async def update_vehicle_fields(db: AsyncSession, vehicle_id: int, fields: dict) -> int:
+    """
+    Update vehicle columns with a single UPDATE statement.
+    
+    Unlike update_vehicle this does not load the row first, so it costs one
+    round-trip. Vehicle objects already loaded in the session are not
+    refreshed; use update_vehicle when the updated object is needed.
+    
+    Args:
+        db: Database session
+        vehicle_id: ID of the vehicle to update
+        fields: Column values to set
+        
+    Returns:
+        Number of rows updated (0 if the vehicle does not exist)
+    """
+    updated = await _update_fields(db, Vehicle, vehicle_id, fields)
+    db.info.pop(_VEHICLE_BY_REG_KEY, None)
+    return updated
+
+
+async def delete_vehicle(db: AsyncSession, vehicle_id: int) -> bool:
     """
     Delete a vehicle record.
     
@@ -150,21 +287,165 @@ def delete_vehicle(db: Session, vehicle_id: int) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    db_vehicle = db.query(Vehicle).filter(Vehicle.id == vehicle_id).first()
+    db_vehicle = await get_vehicle(db, vehicle_id)
     
     if not db_vehicle:
         return False
     
-    db.delete(db_vehicle)
-    db.commit()
+    await db.delete(db_vehicle)
+    db.info.pop(_VEHICLE_BY_REG_KEY, None)
+    await db.flush()
     return True
 
 
+async def bulk_import_vehicles(db: AsyncSession, rows: List[dict]) -> int:
+    """
+    Import many vehicles through a MEMORY staging table.
+    
+    Rows are first loaded into a temporary table without unique indexes,
+    then copied with a single INSERT IGNORE ... SELECT, so the unique
+    registration/chassis/engine number indexes are maintained in one pass.
+    Rows that collide with an existing vehicle are skipped.
+    
+    Args:
+        db: Database session
+        rows: Vehicle column values keyed by column name
+        
+    Returns:
+        Number of vehicles inserted
+    """
+    if not rows:
+        return 0
+    
+    connection = await db.connection()
+    await connection.run_sync(_vehicle_stage.create)
+    try:
+        await db.execute(
+            insert(_vehicle_stage),
+            [{column: row.get(column) for column in _VEHICLE_IMPORT_COLUMNS} for row in rows]
+        )
+        
+        now = datetime.utcnow()
+        result = await db.execute(
+            insert(Vehicle.__table__).prefix_with('IGNORE').from_select(
+                [*_VEHICLE_IMPORT_COLUMNS, 'registration_date', 'created_at', 'updated_at'],
+                select(*_vehicle_stage.columns, literal(now), literal(now), literal(now))
+            )
+        )
+        return result.rowcount
+    finally:
+        # Plain DROP TABLE would implicitly commit the request's transaction
+        await db.execute(text("DROP TEMPORARY TABLE IF EXISTS vehicle_stage"))
+
+
+# ==================== VIOLATION TYPE CACHE ====================
+
+# Violation types are read-mostly reference data, so lookups are served from
+# a process-local TTL cache. Entries hold plain column snapshots (never live
+# ORM objects) keyed by ('id', id), ('code', code) or ('list', ...) and are
+# re-attached to the caller's session on a hit without issuing SQL.
+#
+# Writes only mark their session (see _vt_invalidate); the cache is cleared
+# once that session commits. Until then the writing session bypasses the
+# cache, so its uncommitted values are never cached or hidden by stale ones.
+# Clearing bumps a generation counter, and a snapshot read before the clear
+# is dropped rather than stored.
+_VT_CACHE = TTLCache(maxsize=1024, ttl=300)
+_VT_CACHE_LOCK = threading.Lock()
+_VT_CACHE_GENERATION = 0
+_VT_COLUMNS = tuple(attr.key for attr in inspect(ViolationType).column_attrs)
+
+# Key in AsyncSession.info marking uncommitted violation type writes
+_VT_PENDING_KEY = 'violation_types_written'
+
+
+def _vt_cache_token(db: AsyncSession) -> Optional[int]:
+    """Return the cache generation to read and store under, or None to bypass the cache."""
+    if db.info.get(_VT_PENDING_KEY):
+        return None
+    return _VT_CACHE_GENERATION
+
+
+def _vt_cache_get(key: tuple):
+    with _VT_CACHE_LOCK:
+        return _VT_CACHE.get(key)
+
+
+def _vt_cache_set(key: tuple, value, token: Optional[int]) -> None:
+    with _VT_CACHE_LOCK:
+        if token == _VT_CACHE_GENERATION:
+            _VT_CACHE[key] = value
+
+
+def _vt_cache_clear() -> None:
+    global _VT_CACHE_GENERATION
+    with _VT_CACHE_LOCK:
+        _VT_CACHE_GENERATION += 1
+        _VT_CACHE.clear()
+
+
+def _vt_invalidate(db: AsyncSession) -> None:
+    """Clear the violation type cache when this session's transaction commits."""
+    db.info[_VT_PENDING_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _vt_clear_after_commit(session: Session) -> None:
+    if session.info.pop(_VT_PENDING_KEY, False):
+        _vt_cache_clear()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _vt_discard_after_rollback(session: Session) -> None:
+    # Nothing was committed, so the cached rows are still current
+    session.info.pop(_VT_PENDING_KEY, None)
+
+
+def _vt_snapshot(db_violation_type: ViolationType) -> dict:
+    """Capture the column values of a loaded violation type."""
+    return {key: getattr(db_violation_type, key) for key in _VT_COLUMNS}
+
+
+def _vt_cache_store(db_violation_type: ViolationType, token: Optional[int]) -> dict:
+    """Cache a violation type under both its ID and its code."""
+    snapshot = _vt_snapshot(db_violation_type)
+    _vt_cache_set(('id', db_violation_type.id), snapshot, token)
+    _vt_cache_set(('code', db_violation_type.violation_code), snapshot, token)
+    return snapshot
+
+
+async def _vt_from_snapshot(db: AsyncSession, snapshot: dict) -> ViolationType:
+    """Attach a cached snapshot to the session as a clean persistent object."""
+    db_violation_type = ViolationType(**snapshot)
+    make_transient_to_detached(db_violation_type)
+    return await db.merge(db_violation_type, load=False)
+
+
+async def warm_violation_type_cache(db: AsyncSession) -> int:
+    """
+    Pre-load every violation type into the cache, e.g. at application startup.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Number of violation types cached
+    """
+    token = _vt_cache_token(db)
+    result = await db.execute(select(ViolationType))
+    violation_types = result.scalars().all()
+    
+    for db_violation_type in violation_types:
+        _vt_cache_store(db_violation_type, token)
+    
+    return len(violation_types)
+
+
 # ==================== VIOLATION TYPE CRUD OPERATIONS ====================
 
-def get_violation_type(db: Session, violation_type_id: int) -> Optional[ViolationType]:
+async def get_violation_type(db: AsyncSession, violation_type_id: int) -> Optional[ViolationType]:
     """
-    Retrieve a violation type by ID.
+    Retrieve a violation type by ID (served from the cache when possible).
     
     Args:
         db: Database session
@@ -173,12 +454,25 @@ def get_violation_type(db: Session, violation_type_id: int) -> Optional[Violatio
     Returns:
         ViolationType object or None if not found
     """
-    return db.query(ViolationType).filter(ViolationType.id == violation_type_id).first()
+    token = _vt_cache_token(db)
+    snapshot = _vt_cache_get(('id', violation_type_id)) if token is not None else None
+    if snapshot is not None:
+        return await _vt_from_snapshot(db, snapshot)
+    
+    result = await db.execute(
+        select(ViolationType).where(ViolationType.id == violation_type_id)
+    )
+    db_violation_type = result.scalar_one_or_none()
+    
+    if db_violation_type:
+        _vt_cache_store(db_violation_type, token)
+    
+    return db_violation_type
 
 
-def get_violation_type_by_code(db: Session, code: str) -> Optional[ViolationType]:
+async def get_violation_type_by_code(db: AsyncSession, code: str) -> Optional[ViolationType]:
     """
-    Retrieve a violation type by code.
+    Retrieve a violation type by code (served from the cache when possible).
     
     Args:
         db: Database session
@@ -187,17 +481,32 @@ def get_violation_type_by_code(db: Session, code: str) -> Optional[ViolationType
     Returns:
         ViolationType object or None if not found
     """
-    return db.query(ViolationType).filter(ViolationType.code == code).first()
+    token = _vt_cache_token(db)
+    snapshot = _vt_cache_get(('code', code)) if token is not None else None
+    if snapshot is not None:
+        return await _vt_from_snapshot(db, snapshot)
+    
+    # Statement cached per call site (see get_vehicle_by_registration)
+    result = await db.execute(lambda_stmt(
+        lambda: select(ViolationType).where(ViolationType.violation_code == code)
+    ))
+    db_violation_type = result.scalar_one_or_none()
+    
+    if db_violation_type:
+        _vt_cache_store(db_violation_type, token)
+    
+    return db_violation_type
 
 
-def get_violation_types(
-    db: Session,
+async def get_violation_types(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     severity: Optional[str] = None
 ) -> List[ViolationType]:
     """
-    Retrieve a list of violation types with optional filtering.
+    Retrieve a list of violation types with optional filtering
+    (served from the cache when possible).
     
     Args:
         db: Database session
@@ -208,15 +517,25 @@ def get_violation_types(
     Returns:
         List of ViolationType objects
     """
-    query = db.query(ViolationType)
+    cache_key = ('list', skip, limit, severity)
+    token = _vt_cache_token(db)
+    snapshots = _vt_cache_get(cache_key) if token is not None else None
+    if snapshots is not None:
+        return [await _vt_from_snapshot(db, snapshot) for snapshot in snapshots]
+    
+    stmt = select(ViolationType)
     
     if severity:
-        query = query.filter(ViolationType.severity == severity)
+        stmt = stmt.where(ViolationType.severity == severity)
+    
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    violation_types = result.scalars().all()
     
-    return query.offset(skip).limit(limit).all()
+    _vt_cache_set(cache_key, [_vt_cache_store(vt, token) for vt in violation_types], token)
+    return violation_types
 
 
-def create_violation_type(db: Session, violation_type: ViolationTypeCreate) -> ViolationType:
+async def create_violation_type(db: AsyncSession, violation_type: ViolationTypeCreate) -> ViolationType:
     """
     Create a new violation type record.
     
@@ -236,13 +555,14 @@ def create_violation_type(db: Session, violation_type: ViolationTypeCreate) -> V
         created_at=datetime.utcnow()
     )
     db.add(db_violation_type)
-    db.commit()
-    db.refresh(db_violation_type)
+    await db.flush()
+    await db.refresh(db_violation_type)
+    _vt_invalidate(db)
     return db_violation_type
 
 
-def update_violation_type(
-    db: Session,
+async def update_violation_type(
+    db: AsyncSession,
     violation_type_id: int,
     violation_type_update: ViolationTypeUpdate
 ) -> Optional[ViolationType]:
@@ -257,9 +577,7 @@ def update_violation_type(
     Returns:
         Updated ViolationType object or None if not found
     """
-    db_violation_type = db.query(ViolationType).filter(
-        ViolationType.id == violation_type_id
-    ).first()
+    db_violation_type = await db.get(ViolationType, violation_type_id)
     
     if not db_violation_type:
         return None
@@ -270,12 +588,30 @@ def update_violation_type(
     for field, value in update_data.items():
         setattr(db_violation_type, field, value)
     
-    db.commit()
-    db.refresh(db_violation_type)
+    await db.flush()
+    await db.refresh(db_violation_type)
+    _vt_invalidate(db)
     return db_violation_type
 
 
-def delete_violation_type(db: Session, violation_type_id: int) -> bool:
+async def update_violation_type_fields(db: AsyncSession, violation_type_id: int, fields: dict) -> int:
+    """
+    Update violation type columns with a single UPDATE statement.
+    
+    Args:
+        db: Database session
+        violation_type_id: ID of the violation type to update
+        fields: Column values to set
+        
+    Returns:
+        Number of rows updated (0 if the violation type does not exist)
+    """
+    updated = await _update_fields(db, ViolationType, violation_type_id, fields)
+    _vt_invalidate(db)
+    return updated
+
+
+async def delete_violation_type(db: AsyncSession, violation_type_id: int) -> bool:
     """
     Delete a violation type record.
     
@@ -286,21 +622,20 @@ def delete_violation_type(db: Session, violation_type_id: int) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    db_violation_type = db.query(ViolationType).filter(
-        ViolationType.id == violation_type_id
-    ).first()
+    db_violation_type = await db.get(ViolationType, violation_type_id)
     
     if not db_violation_type:
         return False
     
-    db.delete(db_violation_type)
-    db.commit()
+    await db.delete(db_violation_type)
+    await db.flush()
+    _vt_invalidate(db)
     return True
 
 
 # ==================== CHALLAN CRUD OPERATIONS ====================
 
-def get_challan(db: Session, challan_id: int) -> Optional[Challan]:
+async def get_challan(db: AsyncSession, challan_id: int) -> Optional[Challan]:
     """
     Retrieve a challan by ID.
     
@@ -311,10 +646,11 @@ def get_challan(db: Session, challan_id: int) -> Optional[Challan]:
     Returns:
         Challan object or None if not found
     """
-    return db.query(Challan).filter(Challan.id == challan_id).first()
+    result = await db.execute(select(Challan).where(Challan.id == challan_id))
+    return result.scalar_one_or_none()
 
 
-def get_challan_by_number(db: Session, challan_number: str) -> Optional[Challan]:
+async def get_challan_by_number(db: AsyncSession, challan_number: str) -> Optional[Challan]:
     """
     Retrieve a challan by challan number.
     
@@ -325,11 +661,15 @@ def get_challan_by_number(db: Session, challan_number: str) -> Optional[Challan]
     Returns:
         Challan object or None if not found
     """
-    return db.query(Challan).filter(Challan.challan_number == challan_number).first()
+    # Statement cached per call site (see get_vehicle_by_registration)
+    result = await db.execute(lambda_stmt(
+        lambda: select(Challan).where(Challan.challan_number == challan_number)
+    ))
+    return result.scalar_one_or_none()
 
 
-def get_challans(
-    db: Session,
+async def get_challans(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     vehicle_id: Optional[int] = None,
@@ -354,28 +694,114 @@ def get_challans(
     Returns:
         List of Challan objects
     """
-    query = db.query(Challan)
+    stmt = _filter_challans(
+        select(Challan).options(*_CHALLAN_LIST_OPTIONS),
+        vehicle_id, status, officer_id, date_from, date_to
+    )
+    
+    result = await db.execute(
+        stmt.order_by(Challan.issue_date.desc()).offset(skip).limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def iter_challans(
+    db: AsyncSession,
+    vehicle_id: Optional[int] = None,
+    status: Optional[str] = None,
+    officer_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    batch_size: int = 1000
+) -> AsyncIterator[Challan]:
+    """
+    Stream every matching challan, for reports and CSV exports.
     
+    Rows are read through a server-side cursor in batches of `batch_size`,
+    so memory stays bounded by the batch rather than the result size.
+    
+    Args:
+        db: Database session
+        vehicle_id: Filter by vehicle ID
+        status: Filter by challan status
+        officer_id: Filter by traffic officer ID
+        date_from: Filter by issued date (from)
+        date_to: Filter by issued date (to)
+        batch_size: Number of rows fetched per batch
+        
+    Yields:
+        Challan objects, newest first
+    """
+    stmt = _filter_challans(
+        select(Challan), vehicle_id, status, officer_id, date_from, date_to
+    ).order_by(Challan.issue_date.desc()).execution_options(yield_per=batch_size)
+    
+    result = await db.stream_scalars(stmt)
+    async for challan in result:
+        yield challan
+
+
+def _filter_challans(
+    stmt,
+    vehicle_id: Optional[int],
+    status: Optional[str],
+    officer_id: Optional[int],
+    date_from: Optional[datetime],
+    date_to: Optional[datetime]
+):
+    """Apply the shared challan listing filters to a SELECT."""
     if vehicle_id:
-        query = query.filter(Challan.vehicle_id == vehicle_id)
+        stmt = stmt.where(Challan.vehicle_id == vehicle_id)
     
     if status:
-        query = query.filter(Challan.status == status)
+        stmt = stmt.where(Challan.status == status)
     
     if officer_id:
-        query = query.filter(Challan.officer_id == officer_id)
+        stmt = stmt.where(Challan.officer_id == officer_id)
     
     if date_from:
-        query = query.filter(Challan.issued_date >= date_from)
+        stmt = stmt.where(Challan.issue_date >= date_from)
     
     if date_to:
-        query = query.filter(Challan.issued_date <= date_to)
+        stmt = stmt.where(Challan.issue_date <= date_to)
+    
+    return stmt
+
+
+def _challan_values(challan: ChallanCreate, vehicle_id: int, officer_id: int, now: datetime) -> dict:
+    """
+    Map challan input to Challan column values (everything but the number).
     
-    return query.order_by(Challan.issued_date.desc()).offset(skip).limit(limit).all()
+    Args:
+        challan: Challan data to create
+        vehicle_id: ID of the vehicle
+        officer_id: ID of the issuing officer
+        now: Timestamp used for the issue, creation and update times
+        
+    Returns:
+        Dictionary of column values
+    """
+    additional_charges = getattr(challan, 'additional_charges', None) or 0
+    return {
+        'vehicle_id': vehicle_id,
+        'violation_type_id': challan.violation_type_id,
+        'officer_id': officer_id,
+        'issued_by_officer': getattr(challan, 'issued_by_officer', None) or str(officer_id),
+        'violation_date': getattr(challan, 'violation_date', None) or now,
+        'issue_date': now,
+        'violation_location': challan.location,
+        'remarks': challan.description,
+        'fine_amount': challan.fine_amount,
+        'additional_charges': additional_charges,
+        'total_amount': challan.fine_amount + additional_charges,
+        'status': challan.status or ChallanStatus.PENDING,
+        'created_at': now,
+        'updated_at': now
+    }
 
 
-def create_challan(
-    db: Session,
+async def create_challan(
+    db: AsyncSession,
     challan: ChallanCreate,
     vehicle_id: int,
     officer_id: int
@@ -393,28 +819,57 @@ def create_challan(
         Created Challan object
     """
     # Generate unique challan number
-    challan_number = generate_challan_number(db)
+    challan_number = await generate_challan_number(db)
     
     db_challan = Challan(
         challan_number=challan_number,
-        vehicle_id=vehicle_id,
-        violation_type_id=challan.violation_type_id,
-        officer_id=officer_id,
-        issued_date=datetime.utcnow(),
-        location=challan.location,
-        description=challan.description,
-        fine_amount=challan.fine_amount,
-        status=challan.status or "pending",
-        created_at=datetime.utcnow()
+        **_challan_values(challan, vehicle_id, officer_id, datetime.utcnow())
     )
     db.add(db_challan)
-    db.commit()
-    db.refresh(db_challan)
+    await db.flush()
+    await db.refresh(db_challan)
     return db_challan
 
 
-def update_challan(
-    db: Session,
+async def create_challans_bulk(
+    db: AsyncSession,
+    challans: List[Tuple[ChallanCreate, int, int]]
+) -> List[str]:
+    """
+    Create many challan records with a single multi-row INSERT.
+    
+    Intended for ingestion paths (e.g. camera feeds) that would otherwise
+    call create_challan in a loop, paying several round-trips per row.
+    
+    Args:
+        db: Database session
+        challans: List of (challan data, vehicle ID, issuing officer ID)
+        
+    Returns:
+        Challan numbers of the created challans, in input order
+    """
+    if not challans:
+        return []
+    
+    # Reserve all challan numbers with one counter update
+    date_str, last_serial = await _reserve_challan_serials(db, len(challans))
+    first_serial = last_serial - len(challans) + 1
+    now = datetime.utcnow()
+    
+    rows = [
+        {
+            'challan_number': _format_challan_number(date_str, first_serial + offset),
+            **_challan_values(challan, vehicle_id, officer_id, now)
+        }
+        for offset, (challan, vehicle_id, officer_id) in enumerate(challans)
+    ]
+    
+    await db.execute(insert(Challan).values(rows))
+    return [row['challan_number'] for row in rows]
+
+
+async def update_challan(
+    db: AsyncSession,
     challan_id: int,
     challan_update: ChallanUpdate
 ) -> Optional[Challan]:
@@ -429,7 +884,7 @@ def update_challan(
     Returns:
         Updated Challan object or None if not found
     """
-    db_challan = db.query(Challan).filter(Challan.id == challan_id).first()
+    db_challan = await get_challan(db, challan_id)
     
     if not db_challan:
         return None
@@ -440,12 +895,28 @@ def update_challan(
     for field, value in update_data.items():
         setattr(db_challan, field, value)
     
-    db.commit()
-    db.refresh(db_challan)
+    await db.flush()
+    await db.refresh(db_challan)
     return db_challan
 
 
-def delete_challan(db: Session, challan_id: int) -> bool:
+async def update_challan_fields(db: AsyncSession, challan_id: int, fields: dict) -> int:
+    """
+    Update challan columns with a single UPDATE statement, e.g. marking a
+    challan as paid.
+    
+    Args:
+        db: Database session
+        challan_id: ID of the challan to update
+        fields: Column values to set
+        
+    Returns:
+        Number of rows updated (0 if the challan does not exist)
+    """
+    return await _update_fields(db, Challan, challan_id, fields)
+
+
+async def delete_challan(db: AsyncSession, challan_id: int) -> bool:
     """
     Delete a challan record.
     
@@ -456,19 +927,19 @@ def delete_challan(db: Session, challan_id: int) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    db_challan = db.query(Challan).filter(Challan.id == challan_id).first()
+    db_challan = await get_challan(db, challan_id)
     
     if not db_challan:
         return False
     
-    db.delete(db_challan)
-    db.commit()
+    await db.delete(db_challan)
+    await db.flush()
     return True
 
 
 # ==================== ANALYTICAL OPERATIONS ====================
 
-def get_vehicle_challans_count(db: Session, vehicle_id: int) -> int:
+async def get_vehicle_challans_count(db: AsyncSession, vehicle_id: int) -> int:
     """
     Get total number of challans issued for a vehicle.
     
@@ -479,12 +950,13 @@ def get_vehicle_challans_count(db: Session, vehicle_id: int) -> int:
     Returns:
         Count of challans
     """
-    return db.query(func.count(Challan.id)).filter(
-        Challan.vehicle_id == vehicle_id
-    ).scalar()
+    result = await db.execute(
+        select(func.count(Challan.id)).where(Challan.vehicle_id == vehicle_id)
+    )
+    return result.scalar_one()
 
 
-def get_vehicle_total_fine(db: Session, vehicle_id: int) -> float:
+async def get_vehicle_total_fine(db: AsyncSession, vehicle_id: int) -> float:
     """
     Get total fine amount for a vehicle.
     
@@ -495,13 +967,51 @@ def get_vehicle_total_fine(db: Session, vehicle_id: int) -> float:
     Returns:
         Total fine amount
     """
-    result = db.query(func.sum(Challan.fine_amount)).filter(
-        Challan.vehicle_id == vehicle_id
-    ).scalar()
-    return result or 0.0
+    result = await db.execute(
+        select(func.sum(Challan.fine_amount)).where(Challan.vehicle_id == vehicle_id)
+    )
+    return result.scalar() or 0.0
+
+
+async def get_vehicles_stats_bulk(
+    db: AsyncSession,
+    vehicle_ids: List[int]
+) -> Dict[int, Tuple[int, float]]:
+    """
+    Get challan count and total fine for many vehicles in one query.
+    
+    Use this after get_vehicles() instead of calling
+    get_vehicle_challans_count/get_vehicle_total_fine per vehicle.
+    
+    Args:
+        db: Database session
+        vehicle_ids: IDs of the vehicles
+        
+    Returns:
+        Dictionary mapping vehicle ID to (challan count, total fine).
+        Vehicles without challans map to (0, 0.0).
+    """
+    stats = {vehicle_id: (0, 0.0) for vehicle_id in vehicle_ids}
+    if not stats:
+        return stats
+    
+    result = await db.execute(
+        select(
+            Challan.vehicle_id,
+            func.count(Challan.id),
+            func.coalesce(func.sum(Challan.fine_amount), 0)
+        ).where(
+            Challan.vehicle_id.in_(list(stats))
+        ).group_by(Challan.vehicle_id)
+    )
+    
+    for vehicle_id, count, total_fine in result.all():
+        stats[vehicle_id] = (count, float(total_fine))
+    
+    return stats
 
 
-def get_officer_challans_count(db: Session, officer_id: int, days: int = 30) -> int:
+async def get_officer_challans_count(db: AsyncSession, officer_id: int, days: int = 30) -> int:
     """
     Get number of challans issued by an officer in the last N days.
     
@@ -514,43 +1024,87 @@ def get_officer_challans_count(db: Session, officer_id: int, days: int = 30) ->
         Count of challans
     """
     date_limit = datetime.utcnow() - timedelta(days=days)
-    return db.query(func.count(Challan.id)).filter(
+    result = await db.execute(
+        select(func.count(Challan.id)).where(
+            and_(
+                Challan.officer_id == officer_id,
+                Challan.issue_date >= date_limit
+            )
+        )
+    )
+    return result.scalar_one()
+
+
+async def officer_recent_challan_count(
+    db: AsyncSession,
+    officer_id: int,
+    days: int = 30,
+    cap: int = 1000
+) -> int:
+    """
+    Get a capped count of challans issued by an officer in the last N days.
+    
+    Counting stops after `cap` rows, so dashboard tiles ("1000+") stay fast
+    however many challans the officer has issued.
+    
+    Args:
+        db: Database session
+        officer_id: ID of the officer
+        days: Number of days to look back
+        cap: Maximum count to return
+        
+    Returns:
+        Count of challans, at most `cap`
+    """
+    date_limit = datetime.utcnow() - timedelta(days=days)
+    capped = select(Challan.id).where(
         and_(
             Challan.officer_id == officer_id,
-            Challan.issued_date >= date_limit
+            Challan.issue_date >= date_limit
         )
-    ).scalar()
+    ).limit(cap).subquery()
+    
+    result = await db.execute(select(func.count()).select_from(capped))
+    return result.scalar_one()
 
 
-def get_violation_type_statistics(db: Session) -> List[dict]:
+async def has_pending_challans(db: AsyncSession) -> bool:
     """
-    Get statistics of violation types (count of challans per type).
+    Check whether any challan is pending, without counting them.
     
     Args:
         db: Database session
         
     Returns:
-        List of dictionaries with violation type and challan count
+        True if at least one pending challan exists
+    """
+    result = await db.execute(select(exists().where(Challan.status == ChallanStatus.PENDING)))
+    return bool(result.scalar())
+
+
+async def get_violation_type_statistics(db: AsyncSession) -> List[Mapping[str, Any]]:
     """
-    results = db.query(
-        ViolationType.code,
-        ViolationType.description,
-        func.count(Challan.id).label('count')
-    ).outerjoin(Challan).group_by(
-        ViolationType.id, ViolationType.code, ViolationType.description
-    ).all()
+    Get statistics of violation types (count of challans per type).
     
-    return [
-        {
-            'code': result[0],
-            'description': result[1],
-            'challan_count': result[2]
-        }
-        for result in results
-    ]
+    Args:
+        db: Database session
+        
+    Returns:
+        List of row mappings with 'code', 'description' and 'challan_count'
+    """
+    result = await db.execute(
+        select(
+            ViolationType.violation_code.label('code'),
+            ViolationType.description.label('description'),
+            func.count(Challan.id).label('challan_count')
+        ).outerjoin(Challan).group_by(
+            ViolationType.id, ViolationType.violation_code, ViolationType.description
+        )
+    )
+    return result.mappings().all()
 
 
-def get_pending_challans(db: Session, limit: int = 50) -> List[Challan]:
+async def get_pending_challans(db: AsyncSession, limit: int = 50) -> List[Challan]:
     """
     Get pending challans that need action.
     
@@ -561,12 +1115,16 @@ def get_pending_challans(db: Session, limit: int = 50) -> List[Challan]:
     Returns:
         List of pending Challan objects
     """
-    return db.query(Challan).filter(
-        Challan.status == 'pending'
-    ).order_by(Challan.issued_date).limit(limit).all()
+    # Statement cached per call site (see get_vehicle_by_registration)
+    result = await db.execute(lambda_stmt(
+        lambda: select(Challan).options(*_CHALLAN_LIST_OPTIONS).where(
+            Challan.status == ChallanStatus.PENDING
+        ).order_by(Challan.issue_date).limit(limit)
+    ))
+    return result.scalars().all()
 
 
-def get_paid_challans_count(db: Session, start_date: Optional[datetime] = None) -> int:
+async def get_paid_challans_count(db: AsyncSession, start_date: Optional[datetime] = None) -> int:
     """
     Get count of paid challans.
     
@@ -577,44 +1135,84 @@ def get_paid_challans_count(db: Session, start_date: Optional[datetime] = None)
     Returns:
         Count of paid challans
     """
-    query = db.query(func.count(Challan.id)).filter(Challan.status == 'paid')
+    stmt = select(func.count(Challan.id)).where(Challan.status == ChallanStatus.PAID)
     
     if start_date:
-        query = query.filter(Challan.issued_date >= start_date)
+        stmt = stmt.where(Challan.issue_date >= start_date)
     
-    return query.scalar()
+    result = await db.execute(stmt)
+    return result.scalar_one()
 
 
-def get_dashboard_statistics(db: Session) -> dict:
+async def get_dashboard_statistics(db: AsyncSession, cache: Optional[Redis] = None) -> dict:
     """
     Get overall dashboard statistics.
     
+    When a Redis client is given, results are cached for
+    DASHBOARD_CACHE_TTL seconds; if Redis is unavailable the statistics
+    are computed from the database as usual.
+    
     Args:
         db: Database session
+        cache: Optional Redis client (see config.get_redis)
         
     Returns:
         Dictionary with system statistics
     """
-    total_vehicles = db.query(func.count(Vehicle.id)).scalar()
-    total_challans = db.query(func.count(Challan.id)).scalar()
-    pending_challans = db.query(func.count(Challan.id)).filter(
-        Challan.status == 'pending'
-    ).scalar()
-    total_revenue = db.query(func.sum(Challan.fine_amount)).filter(
-        Challan.status == 'paid'
-    ).scalar()
+    if cache is not None:
+        try:
+            cached = await cache.get(DASHBOARD_CACHE_KEY)
+            if cached:
+                return json.loads(cached)
+        except RedisError:
+            cache = None
+    
+    # One round-trip: vehicle count as a scalar subquery, challan figures
+    # via conditional aggregation over a single scan of challans
+    result = await db.execute(
+        select(
+            select(func.count(Vehicle.id)).scalar_subquery().label('total_vehicles'),
+            func.count(Challan.id).label('total_challans'),
+            func.sum(case((Challan.status == ChallanStatus.PENDING, 1), else_=0)).label('pending_challans'),
+            func.sum(case((Challan.status == ChallanStatus.PAID, Challan.fine_amount), else_=0)).label('total_revenue')
+        ).select_from(Challan)
+    )
+    stats = result.mappings().one()
     
-    return {
-        'total_vehicles': total_vehicles or 0,
-        'total_challans': total_challans or 0,
-        'pending_challans': pending_challans or 0,
-        'total_revenue': total_revenue or 0.0
+    statistics = {
+        'total_vehicles': stats['total_vehicles'] or 0,
+        'total_challans': stats['total_challans'] or 0,
+        'pending_challans': int(stats['pending_challans'] or 0),
+        'total_revenue': float(stats['total_revenue'] or 0.0)
     }
+    
+    if cache is not None:
+        try:
+            await cache.set(DASHBOARD_CACHE_KEY, json.dumps(statistics), ex=DASHBOARD_CACHE_TTL)
+        except RedisError:
+            pass
+    
+    return statistics
 
 
 # ==================== UTILITY FUNCTIONS ====================
 
-def generate_challan_number(db: Session) -> str:
+async def _update_fields(db: AsyncSession, model, record_id: int, fields: dict) -> int:
+    """
+    Issue UPDATE ... WHERE id = :id without loading the row.
+    
+    The session is not synchronised, so already-loaded instances keep
+    their old values until refreshed.
+    """
+    stmt = update(model).where(model.id == record_id).values(
+        {**fields, 'updated_at': datetime.utcnow()}
+    ).execution_options(synchronize_session=False)
+    
+    result = await db.execute(stmt)
+    return result.rowcount
+
+
+async def generate_challan_number(db: AsyncSession) -> str:
     """
     Generate a unique challan number.
     
@@ -624,25 +1222,65 @@ def generate_challan_number(db: Session) -> str:
     Returns:
         Unique challan number in format: CH-YYYYMMDD-XXXXX
     """
+    date_str, serial = await _reserve_challan_serials(db, 1)
+    return _format_challan_number(date_str, serial)
+
+
+def _format_challan_number(date_str: str, serial: int) -> str:
+    """
+    Format a challan number from its date and daily serial.
+    
+    Args:
+        date_str: Issue date as YYYYMMDD
+        serial: Daily serial number
+        
+    Returns:
+        Challan number in format: CH-YYYYMMDD-XXXXX
+    """
+    return f"CH-{date_str}-{str(serial).zfill(5)}"
+
+
+async def _reserve_challan_serials(db: AsyncSession, count: int) -> Tuple[str, int]:
+    """
+    Reserve a block of consecutive challan serials for today.
+    
+    Args:
+        db: Database session
+        count: Number of serials to reserve
+        
+    Returns:
+        Tuple of (date string, last serial reserved); the block is
+        last - count + 1 .. last
+    """
     date_str = datetime.utcnow().strftime("%Y%m%d")
     
-    # Get the count of challans created today
-    count = db.query(func.count(Challan.id)).filter(
-        Challan.created_at >= datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    ).scalar()
+    # Atomically bump today's counter. The upsert locks the counter row
+    # until the transaction ends, so concurrent issuers never share a serial.
+    await db.execute(
+        mysql_insert(ChallanCounter).values(date=date_str, n=count).on_duplicate_key_update(
+            n=ChallanCounter.n + count
+        )
+    )
+    result = await db.execute(
+        select(ChallanCounter.n).where(ChallanCounter.date == date_str)
+    )
     
-    serial = str(count + 1).zfill(5)
-    return f"CH-{date_str}-{serial}"
+    return date_str, result.scalar_one()
 
 
-def search_vehicles(
-    db: Session,
+async def search_vehicles(
+    db: AsyncSession,
     query: str,
     skip: int = 0,
     limit: int = 100
 ) -> List[Vehicle]:
     """
-    Search vehicles by registration number, owner name, or make/model.
+    Search vehicles by registration number or owner name.
+    
+    Plate-like queries (containing a digit, no spaces) use a registration
+    number prefix match on its B-tree index; anything else goes through the
+    FULLTEXT index on (registration_number, owner_name), matching every
+    word as a prefix.
     
     Args:
         db: Database session
@@ -653,18 +1291,27 @@ def search_vehicles(
     Returns:
         List of matching Vehicle objects
     """
-    search_pattern = f"%{query}%"
-    
-    return db.query(Vehicle).filter(
-        or_(
-            Vehicle.registration_number.ilike(search_pattern),
-            Vehicle.make.ilike(search_pattern),
-            Vehicle.model.ilike(search_pattern)
-        )
-    ).offset(skip).limit(limit).all()
+    stmt = select(Vehicle).options(load_only(*_VEHICLE_LIST_COLUMNS, raiseload=True))
+    query = query.strip()
+    
+    if _PLATE_PREFIX_RE.match(query):
+        stmt = stmt.where(Vehicle.registration_number.startswith(query, autoescape=True))
+    else:
+        terms = _FULLTEXT_OPERATOR_RE.sub(' ', query).split()
+        if terms:
+            stmt = stmt.where(
+                match(
+                    Vehicle.registration_number,
+                    Vehicle.owner_name,
+                    against=' '.join(f"+{term}*" for term in terms)
+                ).in_boolean_mode()
+            )
+    
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    return result.scalars().all()
 
 
-def get_vehicle_with_owner(db: Session, vehicle_id: int) -> Optional[dict]:
+async def get_vehicle_with_owner(db: AsyncSession, vehicle_id: int) -> Optional[dict]:
     """
     Get vehicle details along with owner information.
     
@@ -675,9 +1322,9 @@ def get_vehicle_with_owner(db: Session, vehicle_id: int) -> Optional[dict]:
     Returns:
         Dictionary with vehicle and owner details or None
     """
-    result = db.query(Vehicle, User).join(User).filter(
-        Vehicle.id == vehicle_id
-    ).first()
+    result = (await db.execute(
+        select(Vehicle, User).join(User).where(Vehicle.id == vehicle_id)
+    )).first()
     
     if not result:
         return None
@@ -1,6 +1,8 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Enum, Boolean
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, String, CHAR, Float, DateTime, ForeignKey, Text, Boolean, Index
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import relationship
 import enum
 
@@ -10,6 +12,10 @@ Base = declarative_base()
 class Vehicle(Base):
     """Model representing a vehicle in the system."""
     __tablename__ = "vehicles"
+    __table_args__ = (
+        # Inverted index used by vehicle search (MATCH ... AGAINST)
+        Index('ftx_vehicle_search', 'registration_number', 'owner_name', mysql_prefix='FULLTEXT'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     registration_number = Column(String(20), unique=True, index=True, nullable=False)
@@ -65,13 +71,59 @@ class ChallanStatus(enum.Enum):
     RESOLVED = "resolved"
 
 
+# Stored codes for each status. These are persisted, so existing codes must
+# never be renumbered; add new statuses with new codes.
+CHALLAN_STATUS_CODES = {
+    ChallanStatus.ISSUED: 1,
+    ChallanStatus.PAID: 2,
+    ChallanStatus.PENDING: 3,
+    ChallanStatus.CANCELLED: 4,
+    ChallanStatus.APPEALED: 5,
+    ChallanStatus.RESOLVED: 6,
+}
+_CHALLAN_STATUS_BY_CODE = {code: status for status, code in CHALLAN_STATUS_CODES.items()}
+
+
+class ChallanStatusType(TypeDecorator):
+    """
+    Column type storing a ChallanStatus as a 1-byte integer code.
+
+    Accepts ChallanStatus members or their string values ("pending") on the
+    way in and always returns ChallanStatus members.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'mysql':
+            return dialect.type_descriptor(mysql.TINYINT(unsigned=True))
+        return dialect.type_descriptor(SmallInteger())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return CHALLAN_STATUS_CODES[ChallanStatus(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _CHALLAN_STATUS_BY_CODE[value]
+
+
 class Challan(Base):
     """Model representing a traffic challan/fine."""
     __tablename__ = "challans"
+    __table_args__ = (
+        # Composite indexes matching the challan listing filters, which
+        # always sort by issue date
+        Index('ix_challan_vehicle_issued', 'vehicle_id', 'issue_date'),
+        Index('ix_challan_officer_issued', 'officer_id', 'issue_date'),
+        Index('ix_challan_status_issued', 'status', 'issue_date'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     challan_number = Column(String(50), unique=True, index=True, nullable=False)
-    vehicle_id = Column(Integer, ForeignKey("vehicles.id"), nullable=False, index=True)
+    vehicle_id = Column(Integer, ForeignKey("vehicles.id"), nullable=False)
     violation_type_id = Column(Integer, ForeignKey("violation_types.id"), nullable=False, index=True)
     
     # Violation details
@@ -89,7 +141,7 @@ class Challan(Base):
     fine_amount = Column(Float, nullable=False)
     additional_charges = Column(Float, default=0, nullable=False)
     total_amount = Column(Float, nullable=False)
-    status = Column(Enum(ChallanStatus), default=ChallanStatus.ISSUED, nullable=False, index=True)
+    status = Column(ChallanStatusType(), default=ChallanStatus.ISSUED, nullable=False)
     
     # Payment information
     payment_date = Column(DateTime, nullable=True)
@@ -112,3 +164,14 @@ class Challan(Base):
 
     def __repr__(self):
         return f"<Challan(id={self.id}, challan_number={self.challan_number}, vehicle_id={self.vehicle_id}, status={self.status})>"
+
+
+class ChallanCounter(Base):
+    """Model holding the daily serial counter used for challan numbers."""
+    __tablename__ = "challan_counters"
+
+    date = Column(CHAR(8), primary_key=True)  # YYYYMMDD
+    n = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<ChallanCounter(date={self.date}, n={self.n})>"
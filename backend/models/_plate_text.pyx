@@ -0,0 +1,158 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled plate text helpers used by plate_detector.py
+
+Build in place with:
+    cythonize -i backend/models/_plate_text.pyx
+
+Both functions only handle ASCII input and return None for anything else,
+so plate_detector falls back to its pure-Python implementation (which also
+covers the non-ASCII case mapping of str.upper()).
+"""
+
+# Plate characters kept by clean_plate_text
+cdef unsigned char ALLOWED[256]
+# Characters str.split()/str.strip() and re's \s treat as whitespace in ASCII
+cdef unsigned char SPACE[256]
+
+
+cdef void _init_tables():
+    cdef int i
+    cdef unsigned char c
+    for i in range(256):
+        ALLOWED[i] = 0
+        SPACE[i] = 0
+    for c in b'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -':
+        ALLOWED[c] = 1
+    for c in b' \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f':
+        SPACE[c] = 1
+
+
+_init_tables()
+
+
+cdef inline bint _is_letter(unsigned char c):
+    return (65 <= c <= 90) or (97 <= c <= 122)
+
+
+cdef inline bint _is_digit(unsigned char c):
+    return 48 <= c <= 57
+
+
+cdef inline bint _is_separator(unsigned char c):
+    return c == 45 or SPACE[c]
+
+
+cdef inline Py_ssize_t _skip_letters(const unsigned char* s, Py_ssize_t i, Py_ssize_t n):
+    while i < n and _is_letter(s[i]):
+        i += 1
+    return i
+
+
+cdef inline Py_ssize_t _skip_digits(const unsigned char* s, Py_ssize_t i, Py_ssize_t n):
+    while i < n and _is_digit(s[i]):
+        i += 1
+    return i
+
+
+def clean_plate_text(str text):
+    """
+    Same result as plate_detector.clean_plate_text for ASCII text
+
+    Args:
+        text: Raw OCR output text
+
+    Returns:
+        Cleaned text, or None if text is not ASCII
+    """
+    if not text.isascii():
+        return None
+
+    cdef bytes data = text.encode('ascii')
+    cdef const unsigned char* src = <const unsigned char*> <const char*> data
+    cdef Py_ssize_t n = len(data)
+    cdef bytearray out = bytearray(n)
+    cdef unsigned char* dst = <unsigned char*> <char*> out
+    cdef Py_ssize_t i, length = 0, start = 0
+    cdef unsigned char c
+    cdef bint pending_space = False, seen_word = False
+
+    for i in range(n):
+        c = src[i]
+        if SPACE[c]:
+            # Runs of whitespace between words collapse to one space
+            pending_space = seen_word
+            continue
+        if pending_space:
+            dst[length] = 32
+            length += 1
+            pending_space = False
+        seen_word = True
+        if 97 <= c <= 122:
+            c -= 32
+        if ALLOWED[c]:
+            dst[length] = c
+            length += 1
+
+    # Filtering can leave spaces at either end
+    while start < length and dst[start] == 32:
+        start += 1
+    while length > start and dst[length - 1] == 32:
+        length -= 1
+
+    return (<char*> dst)[start:length].decode('ascii')
+
+
+def validate_plate_format_in(str text):
+    """
+    Same result as plate_detector's Indian plate regex check for ASCII text
+
+    Matches XX[-/space]9[9][-/space]X[X][X][-/space]9[9][9][9] after
+    stripping, case-insensitively.
+
+    Args:
+        text: Extracted plate text
+
+    Returns:
+        True/False, or None if text is not ASCII
+    """
+    if not text.isascii():
+        return None
+
+    cdef bytes data = text.encode('ascii')
+    cdef const unsigned char* s = <const unsigned char*> <const char*> data
+    cdef Py_ssize_t n = len(data), i = 0, j
+
+    while i < n and SPACE[s[i]]:
+        i += 1
+    while n > i and SPACE[s[n - 1]]:
+        n -= 1
+
+    # Groups alternate between disjoint character classes, so counting each
+    # run is equivalent to the regex match
+    j = _skip_letters(s, i, n)
+    if j - i != 2:
+        return False
+    i = j
+    if i < n and _is_separator(s[i]):
+        i += 1
+
+    j = _skip_digits(s, i, n)
+    if not 1 <= j - i <= 2:
+        return False
+    i = j
+    if i < n and _is_separator(s[i]):
+        i += 1
+
+    j = _skip_letters(s, i, n)
+    if not 1 <= j - i <= 3:
+        return False
+    i = j
+    if i < n and _is_separator(s[i]):
+        i += 1
+
+    j = _skip_digits(s, i, n)
+    if not 1 <= j - i <= 4:
+        return False
+
+    return j == n
@@ -5,17 +5,159 @@ Uses YOLOv8 for detection and EasyOCR for text recognition
 
 import cv2
 import numpy as np
+import torch
 import easyocr
 from ultralytics import YOLO
 import logging
+import re
+import functools
+import threading
 from typing import Tuple, List, Dict, Optional
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import os
 
+# Optional: libjpeg-turbo's SIMD decoder for JPEG inputs
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _TURBO_JPEG = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except (ImportError, OSError, RuntimeError):
+    _TURBO_JPEG = None
+    TURBOJPEG_AVAILABLE = False
+
+# Optional: compiled plate text helpers (see _plate_text.pyx)
+try:
+    from _plate_text import (
+        clean_plate_text as _clean_plate_text_ascii,
+        validate_plate_format_in as _validate_plate_format_in_ascii
+    )
+    PLATE_TEXT_EXT_AVAILABLE = True
+except ImportError:
+    PLATE_TEXT_EXT_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Input shapes are fixed per batch size, so let cuDNN pick the fastest kernels
+torch.backends.cudnn.benchmark = True
+
+# Inference resolution the TensorRT engine is built for
+IMG_SIZE = 640
+
+_JPEG_SUFFIXES = ('.jpg', '.jpeg')
+
+# Extensions (lowercase, without the dot) batch_process picks up
+_IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'bmp', 'tiff'})
+
+# Image decoding threads used to prefetch batches in batch_process
+IO_WORKERS = 4
+
+# Upper bound on parallel EasyOCR workers when running on CPU
+OCR_WORKERS = 4
+
+# Fixed size plate crops are resized to for batched OCR
+OCR_WIDTH = 200
+OCR_HEIGHT = 50
+
+# EasyOCR's recognizer works at 64 px height; taller crops only add work
+OCR_MAX_HEIGHT = 64
+
+
+def _exif_orientation(tiff: bytes) -> int:
+    """
+    Read the Orientation tag from the TIFF structure of an EXIF block
+    
+    Args:
+        tiff: EXIF payload following the APP1 'Exif' header
+        
+    Returns:
+        Orientation value (1 = upright if the tag is missing or unreadable)
+    """
+    order = {b'II': 'little', b'MM': 'big'}.get(tiff[:2])
+    if order is None or len(tiff) < 8:
+        return 1
+    
+    ifd = int.from_bytes(tiff[4:8], order)
+    if ifd + 2 > len(tiff):
+        return 1
+    
+    # IFD0 entries are 12 bytes: tag, type, count, value (SHORTs left-aligned)
+    count = int.from_bytes(tiff[ifd:ifd + 2], order)
+    for entry in range(ifd + 2, min(ifd + 2 + 12 * count, len(tiff) - 11), 12):
+        if int.from_bytes(tiff[entry:entry + 2], order) == 0x0112:
+            return int.from_bytes(tiff[entry + 8:entry + 10], order)
+    return 1
+
+
+def _jpeg_orientation(data: bytes) -> int:
+    """
+    Return the EXIF orientation recorded in a JPEG's header segments
+    
+    Args:
+        data: JPEG file contents
+        
+    Returns:
+        Orientation value (1 = upright if none is recorded or data is not a JPEG)
+    """
+    if data[:2] != b'\xff\xd8':
+        return 1
+    
+    pos = 2
+    while pos + 4 <= len(data) and data[pos] == 0xFF:
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker == 0xDA:
+            # Start of scan: no metadata segments follow
+            break
+        length = int.from_bytes(data[pos + 2:pos + 4], 'big')
+        if marker == 0xE1 and data[pos + 4:pos + 10] == b'Exif\x00\x00':
+            return _exif_orientation(data[pos + 10:pos + 2 + length])
+        pos += 2 + length
+    return 1
+
+
+def _decode_image(image_path: str) -> Optional[np.ndarray]:
+    """
+    Decode an image file to a BGR array
+    
+    Upright JPEGs go through TurboJPEG when available. Everything else is
+    decoded with cv2.imdecode, which (like cv2.imread) applies the EXIF
+    orientation and detects the format from the contents, so rotated photos
+    and mislabelled files decode as before.
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        BGR image array, or None if the file cannot be read or decoded
+    """
+    try:
+        if _TURBO_JPEG is not None and image_path.lower().endswith(_JPEG_SUFFIXES):
+            with open(image_path, 'rb') as f:
+                buf = f.read()
+            if _jpeg_orientation(buf) == 1:
+                try:
+                    return _TURBO_JPEG.decode(buf, pixel_format=TJPF_BGR)
+                except OSError:
+                    # Not a JPEG despite the extension (or damaged): let cv2 try
+                    pass
+            data = np.frombuffer(buf, dtype=np.uint8)
+        else:
+            data = np.fromfile(image_path, dtype=np.uint8)
+        
+        if data.size == 0:
+            return None
+        return cv2.imdecode(data, cv2.IMREAD_COLOR)
+    except OSError:
+        return None
+
 
 class PlateDetector:
     """
@@ -27,7 +169,9 @@ class PlateDetector:
         model_path: str = "yolov8n.pt",
         confidence_threshold: float = 0.5,
         ocr_languages: List[str] = None,
-        device: str = "cpu"
+        device: str = "cpu",
+        use_tensorrt: bool = True,
+        max_batch_size: int = 16
     ):
         """
         Initialize the PlateDetector with YOLOv8 model and EasyOCR reader
@@ -37,26 +181,181 @@ class PlateDetector:
             confidence_threshold: Confidence threshold for YOLO predictions
             ocr_languages: Languages for OCR (default: ['en'])
             device: Device to use ('cpu' or 'cuda')
+            use_tensorrt: On CUDA, run the model as an FP16 TensorRT engine
+            max_batch_size: Largest batch the TensorRT engine is built for
         """
         self.confidence_threshold = confidence_threshold
         self.device = device
         self.ocr_languages = ocr_languages or ['en']
+        self.max_batch_size = max_batch_size
+        # Image decoding releases the GIL, so decoding overlaps with inference
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix='plate-io')
+        # Reused host buffer the batched OCR resizes crops into; the lock
+        # guards it when a shared detector is used from several threads
+        self._ocr_buf = np.empty((max_batch_size, OCR_HEIGHT, OCR_WIDTH, 3), dtype=np.uint8)
+        self._ocr_lock = threading.Lock()
+        # Ultralytics predictors keep per-call state and are not thread-safe,
+        # so YOLO inference on a shared detector runs one call at a time
+        self._infer_lock = threading.Lock()
+        # On CPU, torch releases the GIL during forward passes, so several
+        # OCR calls can run on separate cores. The pool only uses the cores
+        # torch's intra-op threads leave free (see configure_cpu_threads),
+        # so it never oversubscribes and never changes torch's global state.
+        # On CUDA the single batched call is already optimal.
+        self._ocr_pool = None
+        self._ocr_workers = 1
+        if device == 'cpu':
+            cpu_count = os.cpu_count() or 1
+            self._ocr_workers = min(OCR_WORKERS, max(1, cpu_count // torch.get_num_threads()))
+            if self._ocr_workers > 1:
+                self._ocr_pool = ThreadPoolExecutor(
+                    max_workers=self._ocr_workers,
+                    thread_name_prefix='plate-ocr'
+                )
         
         try:
             # Load YOLOv8 model
             logger.info(f"Loading YOLOv8 model from {model_path}")
-            self.yolo_model = YOLO(model_path)
-            self.yolo_model.to(device)
+            self.yolo_model = self._load_yolo_model(model_path, use_tensorrt)
             
             # Initialize EasyOCR reader
             logger.info(f"Initializing EasyOCR reader for languages: {self.ocr_languages}")
-            self.ocr_reader = easyocr.Reader(self.ocr_languages, gpu=(device == 'cuda'))
+            self.ocr_reader = easyocr.Reader(
+                self.ocr_languages,
+                gpu=(device == 'cuda'),
+                cudnn_benchmark=(device == 'cuda')
+            )
+            self._warmup()
             
             logger.info("PlateDetector initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing PlateDetector: {str(e)}")
+            self.close(wait=False)
             raise
     
+    def close(self, wait: bool = True):
+        """
+        Shut down the image prefetch and CPU OCR threads
+        
+        Args:
+            wait: Wait for queued work to finish
+        """
+        self._io_pool.shutdown(wait=wait)
+        if self._ocr_pool is not None:
+            self._ocr_pool.shutdown(wait=wait)
+    
+    def _warmup(self):
+        """
+        Run YOLO and batched OCR on blank inputs so cuDNN autotuning happens
+        at startup rather than on the first real request
+        
+        YOLO is warmed at a single image and a full batch, the two shapes
+        process_image() and batch_process() feed it at IMG_SIZE.
+        """
+        if self.device != 'cuda':
+            return
+        logger.info("Warming up YOLO model")
+        dummy = np.zeros((IMG_SIZE, IMG_SIZE, 3), dtype=np.uint8)
+        self._infer(dummy)
+        self._infer([dummy] * self.max_batch_size)
+        
+        logger.info("Warming up OCR reader")
+        self.ocr_reader.readtext_batched(
+            np.zeros([self.max_batch_size, OCR_HEIGHT, OCR_WIDTH, 3], dtype=np.uint8),
+            n_width=OCR_WIDTH,
+            n_height=OCR_HEIGHT
+        )
+    
+    def _load_yolo_model(self, model_path: str, use_tensorrt: bool) -> YOLO:
+        """
+        Load the YOLOv8 model, preferring a TensorRT engine on CUDA
+        
+        The engine is exported once (FP16, dynamic batch) and cached next to
+        the .pt weights, so later instantiations load it directly. The cached
+        file name records the batch size, input size and precision, so an
+        engine built for another configuration is never reused. CPU and
+        non-.pt models keep the plain PyTorch path.
+        
+        Args:
+            model_path: Path to YOLOv8 model weights or model name
+            use_tensorrt: Whether TensorRT may be used on CUDA
+            
+        Returns:
+            Loaded YOLO model
+        """
+        if self.device == 'cuda' and use_tensorrt and model_path.endswith('.pt'):
+            weights = Path(model_path)
+            engine_path = weights.with_name(
+                f"{weights.stem}-b{self.max_batch_size}-{IMG_SIZE}-fp16.engine"
+            )
+            try:
+                if not engine_path.exists():
+                    logger.info(f"Exporting TensorRT engine to {engine_path}")
+                    # Ultralytics always writes <weights>.engine; move it to
+                    # the configuration-specific name
+                    exported = YOLO(model_path).export(
+                        format="engine",
+                        imgsz=IMG_SIZE,
+                        half=True,
+                        dynamic=True,
+                        batch=self.max_batch_size,
+                        workspace=4
+                    )
+                    os.replace(exported, engine_path)
+                logger.info(f"Loading TensorRT engine from {engine_path}")
+                # Engines are bound to the GPU they were built on; no .to()
+                return YOLO(str(engine_path), task='detect')
+            except Exception as e:
+                logger.warning(f"TensorRT unavailable, using PyTorch model: {str(e)}")
+        
+        model = YOLO(model_path)
+        model.to(self.device)
+        return model
+    
+    def _infer(self, images):
+        """
+        Run the YOLO model without autograd, under FP16 autocast on CUDA
+        
+        Calls are serialized, so a shared detector can be used from several
+        threads.
+        
+        Args:
+            images: Image array or list of image arrays
+            
+        Returns:
+            List of ultralytics Results objects
+        """
+        # TensorRT engines already run in FP16; autocast only applies to
+        # the PyTorch model
+        use_amp = self.device == 'cuda' and isinstance(self.yolo_model.model, torch.nn.Module)
+        amp = torch.autocast('cuda', dtype=torch.float16) if use_amp else nullcontext()
+        with self._infer_lock, torch.inference_mode(), amp:
+            # A fixed imgsz keeps the letterboxed input shape stable so cuDNN
+            # caches one plan instead of one per source resolution
+            return self.yolo_model(
+                images,
+                imgsz=IMG_SIZE,
+                conf=self.confidence_threshold,
+                verbose=False
+            )
+    
+    @staticmethod
+    def _read_image(image_path: str) -> np.ndarray:
+        """
+        Decode an image file, raising ValueError if it cannot be read
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            BGR image array
+        """
+        image = _decode_image(image_path)
+        if image is None:
+            logger.error(f"Failed to read image: {image_path}")
+            raise ValueError(f"Invalid image path: {image_path}")
+        return image
+    
     def detect_plates(self, image_path: str) -> List[Dict]:
         """
         Detect number plates in an image
@@ -69,48 +368,36 @@ class PlateDetector:
         """
         try:
             # Read image
-            image = cv2.imread(image_path)
-            if image is None:
-                logger.error(f"Failed to read image: {image_path}")
-                raise ValueError(f"Invalid image path: {image_path}")
+            image = self._read_image(image_path)
             
             logger.info(f"Processing image: {image_path}")
             
-            # Run YOLO detection
-            results = self.yolo_model(image, conf=self.confidence_threshold, verbose=False)
-            
-            detections = []
-            if results and len(results) > 0:
-                result = results[0]
-                
-                # Extract detections
-                if result.boxes is not None:
-                    for box in result.boxes:
-                        x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
-                        confidence = float(box.conf[0])
-                        class_id = int(box.cls[0])
-                        
-                        detection = {
-                            'coordinates': {
-                                'x1': x1,
-                                'y1': y1,
-                                'x2': x2,
-                                'y2': y2
-                            },
-                            'confidence': confidence,
-                            'class_id': class_id,
-                            'width': x2 - x1,
-                            'height': y2 - y1
-                        }
-                        detections.append(detection)
-            
-            logger.info(f"Detected {len(detections)} plate(s)")
-            return detections
+            return self._detect_plates_arr(image)
             
         except Exception as e:
             logger.error(f"Error in plate detection: {str(e)}")
             raise
     
+    def _detect_plates_arr(self, image: np.ndarray) -> List[Dict]:
+        """
+        Detect number plates in an already decoded image
+        
+        Args:
+            image: BGR image array
+            
+        Returns:
+            List of detected plates with coordinates and confidence scores
+        """
+        # Run YOLO detection
+        results = self._infer(image)
+        
+        detections = []
+        if results and len(results) > 0:
+            detections = self._parse_detections(results[0])
+        
+        logger.info(f"Detected {len(detections)} plate(s)")
+        return detections
+    
     def extract_plate_text(self, image_path: str, coordinates: Dict) -> str:
         """
         Extract text from a detected plate region using OCR
@@ -124,38 +411,200 @@ class PlateDetector:
         """
         try:
             # Read image
-            image = cv2.imread(image_path)
-            if image is None:
-                logger.error(f"Failed to read image: {image_path}")
-                raise ValueError(f"Invalid image path: {image_path}")
+            image = self._read_image(image_path)
             
-            # Extract plate region
-            x1 = coordinates['x1']
-            y1 = coordinates['y1']
-            x2 = coordinates['x2']
-            y2 = coordinates['y2']
+            return self._extract_plate_text_arr(image, coordinates)
             
-            plate_region = image[y1:y2, x1:x2]
+        except Exception as e:
+            logger.error(f"Error in text extraction: {str(e)}")
+            raise
+    
+    def extract_plate_text_batch(self, crops: List[np.ndarray]) -> List[str]:
+        """
+        Extract text from many plate crops with a single batched OCR call
+        
+        Crops are resized to OCR_WIDTH x OCR_HEIGHT into a preallocated
+        buffer so they can share one recognizer forward pass without a new
+        allocation per crop. More than max_batch_size crops are split into
+        several calls.
+        
+        Args:
+            crops: Plate region arrays (empty crops yield "")
+            
+        Returns:
+            Extracted text for each crop, in input order
+        """
+        texts = [""] * len(crops)
+        indices = [i for i, crop in enumerate(crops) if crop.size > 0]
+        if len(indices) < len(crops):
+            logger.warning(f"{len(crops) - len(indices)} empty plate region(s) extracted")
+        if not indices:
+            return texts
+        
+        buf = self._ocr_buf
+        batch_results = []
+        with self._ocr_lock:
+            for start in range(0, len(indices), len(buf)):
+                chunk = indices[start:start + len(buf)]
+                for slot, i in zip(buf, chunk):
+                    cv2.resize(crops[i], (OCR_WIDTH, OCR_HEIGHT), dst=slot)
+                # Already at the target size, so EasyOCR needs no resize
+                batch_results.extend(self._recognize(buf[:len(chunk)]))
+        for i, results in zip(indices, batch_results):
+            if results:
+                texts[i] = " ".join([text[1] for text in results]).strip()
+        
+        logger.info(f"Extracted text for {len(indices)} plate(s)")
+        return texts
+    
+    def _recognize(self, crops: np.ndarray) -> List[List]:
+        """
+        Run EasyOCR on a batch of same-size crops
+        
+        On CPU the batch is split across the OCR thread pool; otherwise it
+        is a single readtext_batched call.
+        
+        Args:
+            crops: (N, OCR_HEIGHT, OCR_WIDTH, 3) uint8 array
             
-            if plate_region.size == 0:
-                logger.warning("Empty plate region extracted")
-                return ""
+        Returns:
+            readtext results for each crop, in input order
+        """
+        if self._ocr_pool is None or len(crops) < 2:
+            return self.ocr_reader.readtext_batched(crops)
+        
+        parts = np.array_split(crops, min(len(crops), self._ocr_workers))
+        futures = [self._ocr_pool.submit(self.ocr_reader.readtext_batched, part) for part in parts]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+    
+    def _parse_detections(self, result) -> List[Dict]:
+        """
+        Convert one YOLO result into detection dictionaries
+        
+        Args:
+            result: ultralytics Results object for a single image
             
-            # Perform OCR
-            results = self.ocr_reader.readtext(plate_region)
+        Returns:
+            List of detected plates with coordinates and confidence scores
+        """
+        detections = []
+        if result.boxes is not None:
+            # One device-to-host transfer per field instead of per box
+            boxes = result.boxes
+            xyxy = boxes.xyxy.cpu().numpy().astype(np.int32).tolist()
+            confs = boxes.conf.cpu().numpy().tolist()
+            class_ids = boxes.cls.cpu().numpy().astype(np.int32).tolist()
+            
+            for (x1, y1, x2, y2), confidence, class_id in zip(xyxy, confs, class_ids):
+                detection = {
+                    'coordinates': {
+                        'x1': x1,
+                        'y1': y1,
+                        'x2': x2,
+                        'y2': y2
+                    },
+                    'confidence': confidence,
+                    'class_id': class_id,
+                    'width': x2 - x1,
+                    'height': y2 - y1
+                }
+                detections.append(detection)
+        return detections
+    
+    def _extract_plate_text_arr(self, image: np.ndarray, coordinates: Dict) -> str:
+        """
+        Extract text from a plate region of an already decoded image
+        
+        Args:
+            image: BGR image array
+            coordinates: Dictionary containing x1, y1, x2, y2 coordinates
             
-            # Extract and clean text
-            extracted_text = ""
-            if results:
-                extracted_text = " ".join([text[1] for text in results])
-                extracted_text = extracted_text.strip()
+        Returns:
+            Extracted text from the number plate
+        """
+        # Extract plate region
+        x1 = coordinates['x1']
+        y1 = coordinates['y1']
+        x2 = coordinates['x2']
+        y2 = coordinates['y2']
+        
+        plate_region = image[y1:y2, x1:x2]
+        
+        if plate_region.size == 0:
+            logger.warning("Empty plate region extracted")
+            return ""
+        
+        # Downscale close-up plates before OCR
+        h, w = plate_region.shape[:2]
+        if h > OCR_MAX_HEIGHT:
+            scale = OCR_MAX_HEIGHT / h
+            plate_region = cv2.resize(
+                plate_region,
+                (max(1, int(w * scale)), OCR_MAX_HEIGHT),
+                interpolation=cv2.INTER_AREA
+            )
+        
+        # Perform OCR
+        results = self.ocr_reader.readtext(plate_region)
+        
+        # Extract and clean text
+        extracted_text = ""
+        if results:
+            extracted_text = " ".join([text[1] for text in results])
+            extracted_text = extracted_text.strip()
+        
+        logger.info(f"Extracted text: {extracted_text}")
+        return extracted_text
+    
+    @staticmethod
+    def _crop_plates(image: np.ndarray, detections: List[Dict]) -> List[np.ndarray]:
+        """
+        Cut the plate regions of detections out of an image
+        
+        Args:
+            image: BGR image array the detections belong to
+            detections: Detections from _parse_detections()
             
-            logger.info(f"Extracted text: {extracted_text}")
-            return extracted_text
+        Returns:
+            Plate region arrays, one per detection
+        """
+        crops = []
+        for detection in detections:
+            coords = detection['coordinates']
+            crops.append(image[coords['y1']:coords['y2'], coords['x1']:coords['x2']])
+        return crops
+    
+    @staticmethod
+    def _build_plate_results(detections: List[Dict], texts: List[str]) -> List[Dict]:
+        """
+        Build the process_image() result list from detections and OCR text
+        
+        Args:
+            detections: Detections from _parse_detections()
+            texts: Extracted text for each detection
             
-        except Exception as e:
-            logger.error(f"Error in text extraction: {str(e)}")
-            raise
+        Returns:
+            List of plates with detected coordinates and extracted text
+        """
+        results = []
+        for idx, (detection, text) in enumerate(zip(detections, texts)):
+            coordinates = detection['coordinates']
+            
+            result = {
+                'plate_id': idx,
+                'coordinates': coordinates,
+                'confidence': detection['confidence'],
+                'plate_text': text,
+                'dimensions': {
+                    'width': detection['width'],
+                    'height': detection['height']
+                }
+            }
+            results.append(result)
+        return results
     
     def process_image(self, image_path: str) -> List[Dict]:
         """
@@ -170,26 +619,15 @@ class PlateDetector:
         try:
             logger.info(f"Starting complete processing for: {image_path}")
             
+            # Decode once and reuse the array for detection and OCR
+            image = self._read_image(image_path)
+            
             # Detect plates
-            detections = self.detect_plates(image_path)
+            detections = self._detect_plates_arr(image)
             
-            # Extract text from each detected plate
-            results = []
-            for idx, detection in enumerate(detections):
-                coordinates = detection['coordinates']
-                text = self.extract_plate_text(image_path, coordinates)
-                
-                result = {
-                    'plate_id': idx,
-                    'coordinates': coordinates,
-                    'confidence': detection['confidence'],
-                    'plate_text': text,
-                    'dimensions': {
-                        'width': detection['width'],
-                        'height': detection['height']
-                    }
-                }
-                results.append(result)
+            # Extract text from all detected plates in one OCR call
+            texts = self.extract_plate_text_batch(self._crop_plates(image, detections))
+            results = self._build_plate_results(detections, texts)
             
             logger.info(f"Completed processing: {len(results)} plate(s) detected and processed")
             return results
@@ -202,7 +640,9 @@ class PlateDetector:
         self,
         image_path: str,
         detections: List[Dict],
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        image: Optional[np.ndarray] = None,
+        inplace: bool = False
     ) -> np.ndarray:
         """
         Visualize detected plates on the image
@@ -211,18 +651,21 @@ class PlateDetector:
             image_path: Path to the image file
             detections: List of detections from process_image()
             output_path: Optional path to save the visualization
+            image: Already decoded image; skips reading image_path when given
+            inplace: Draw directly on the given image instead of a copy
             
         Returns:
             Image array with drawn bounding boxes and text
         """
         try:
-            # Read image
-            image = cv2.imread(image_path)
+            # Read image; a freshly decoded image is private, so it is
+            # drawn on directly
             if image is None:
-                logger.error(f"Failed to read image: {image_path}")
-                raise ValueError(f"Invalid image path: {image_path}")
-            
-            image_copy = image.copy()
+                image_copy = self._read_image(image_path)
+            elif inplace:
+                image_copy = image
+            else:
+                image_copy = image.copy()
             
             # Draw bounding boxes and text
             for detection in detections:
@@ -265,52 +708,200 @@ class PlateDetector:
             logger.error(f"Error in visualization: {str(e)}")
             raise
     
-    def batch_process(self, image_dir: str) -> List[Dict]:
+    def batch_process(self, image_dir: str, batch_size: int = 16, prefetch: int = 2) -> List[Dict]:
         """
         Process multiple images from a directory
         
+        Images are sent to YOLO batch_size at a time so each model call
+        covers a whole batch instead of a single image. The next prefetch
+        batches are decoded on background threads while the current batch
+        is being processed.
+        
         Args:
             image_dir: Directory containing images
+            batch_size: Number of images per YOLO call (capped at the
+                TensorRT engine's max_batch_size)
+            prefetch: Number of batches to decode ahead
             
         Returns:
             List of processing results for all images
         """
         try:
-            image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff'}
-            image_files = [
-                f for f in os.listdir(image_dir)
-                if Path(f).suffix.lower() in image_extensions
-            ]
+            image_files = []
+            with os.scandir(image_dir) as entries:
+                for entry in entries:
+                    stem, _, extension = entry.name.rpartition('.')
+                    # An empty stem means no suffix ('jpg') or a dotfile ('.jpg')
+                    if stem and extension.lower() in _IMAGE_EXTENSIONS and entry.is_file():
+                        image_files.append(entry.name)
             
             logger.info(f"Found {len(image_files)} images in {image_dir}")
             
+            batch_size = max(1, min(batch_size, self.max_batch_size))
+            batches = [
+                image_files[start:start + batch_size]
+                for start in range(0, len(image_files), batch_size)
+            ]
+            
+            def submit(files):
+                return [
+                    (f, self._io_pool.submit(_decode_image, os.path.join(image_dir, f)))
+                    for f in files
+                ]
+            
+            pending = deque(submit(files) for files in batches[:prefetch + 1])
+            next_batch = len(pending)
+            
             batch_results = []
-            for image_file in image_files:
-                image_path = os.path.join(image_dir, image_file)
-                try:
-                    results = self.process_image(image_path)
-                    batch_results.append({
-                        'image_file': image_file,
-                        'detections': results,
-                        'status': 'success'
-                    })
-                except Exception as e:
-                    logger.error(f"Error processing {image_file}: {str(e)}")
-                    batch_results.append({
-                        'image_file': image_file,
-                        'error': str(e),
-                        'status': 'failed'
-                    })
+            while pending:
+                images = [(f, future.result()) for f, future in pending.popleft()]
+                if next_batch < len(batches):
+                    pending.append(submit(batches[next_batch]))
+                    next_batch += 1
+                batch_results.extend(self._process_batch(image_dir, images))
             
             return batch_results
             
         except Exception as e:
             logger.error(f"Error in batch processing: {str(e)}")
             raise
+    
+    def _process_batch(
+        self,
+        image_dir: str,
+        images: List[Tuple[str, Optional[np.ndarray]]]
+    ) -> List[Dict]:
+        """
+        Detect and read plates for one batch of images with a single YOLO call
+        
+        Args:
+            image_dir: Directory containing the images
+            images: (file name, decoded image or None if unreadable) pairs
+            
+        Returns:
+            batch_process() entries for the batch, in input order
+        """
+        entries = {}
+        loaded = []
+        for image_file, image in images:
+            if image is None:
+                logger.error(f"Error processing {image_file}: Failed to read image")
+                entries[image_file] = {
+                    'image_file': image_file,
+                    'error': f"Invalid image path: {os.path.join(image_dir, image_file)}",
+                    'status': 'failed'
+                }
+            else:
+                loaded.append((image_file, image))
+        
+        if loaded:
+            try:
+                results = self._infer([image for _, image in loaded])
+            except Exception as e:
+                logger.error(f"Error in batch detection: {str(e)}")
+                results = None
+                for image_file, _ in loaded:
+                    entries[image_file] = {
+                        'image_file': image_file,
+                        'error': str(e),
+                        'status': 'failed'
+                    }
+            
+            if results is not None:
+                # Collect the crops of every image so OCR runs once per batch
+                parsed = []
+                crops = []
+                for (image_file, image), result in zip(loaded, results):
+                    detections = self._parse_detections(result)
+                    parsed.append((image_file, detections))
+                    crops.extend(self._crop_plates(image, detections))
+                
+                try:
+                    texts = self.extract_plate_text_batch(crops)
+                except Exception as e:
+                    logger.error(f"Error in batch text extraction: {str(e)}")
+                    for image_file, _ in parsed:
+                        entries[image_file] = {
+                            'image_file': image_file,
+                            'error': str(e),
+                            'status': 'failed'
+                        }
+                else:
+                    offset = 0
+                    for image_file, detections in parsed:
+                        image_texts = texts[offset:offset + len(detections)]
+                        offset += len(detections)
+                        entries[image_file] = {
+                            'image_file': image_file,
+                            'detections': self._build_plate_results(detections, image_texts),
+                            'status': 'success'
+                        }
+        
+        return [entries[image_file] for image_file, _ in images]
+
+
+def configure_cpu_threads(ocr_workers: int = OCR_WORKERS) -> None:
+    """
+    Split the CPU between parallel OCR workers, once at application startup
+    
+    Sets torch's process-wide intra-op thread count to an equal share of
+    the cores per OCR worker. CPU detectors created afterwards run that many
+    OCR calls in parallel; without this call they keep torch's default
+    threading and recognize each batch in one call.
+    
+    Args:
+        ocr_workers: Number of OCR calls to run in parallel
+    """
+    cpu_count = os.cpu_count() or 1
+    torch.set_num_threads(max(1, cpu_count // max(1, min(ocr_workers, cpu_count))))
+
+
+# Unbounded: a deployment only uses a handful of configurations, and an
+# evicted detector would leak its I/O and OCR thread pools
+@functools.lru_cache(maxsize=None)
+def get_plate_detector(
+    model_path: str = "yolov8n.pt",
+    device: str = "cpu",
+    ocr_languages: Tuple[str, ...] = ('en',),
+    confidence_threshold: float = 0.5
+) -> PlateDetector:
+    """
+    Get a shared PlateDetector for the given configuration
+    
+    Loading YOLO and EasyOCR takes seconds and hundreds of MB, so request
+    handlers should use this factory rather than constructing PlateDetector
+    themselves. The instance is shared (it may be used from several
+    threads); do not close() it.
+    
+    Args:
+        model_path: Path to YOLOv8 model weights or model name
+        device: Device to use ('cpu' or 'cuda')
+        ocr_languages: Languages for OCR (a tuple, so it can be cached)
+        confidence_threshold: Confidence threshold for YOLO predictions
+        
+    Returns:
+        Cached PlateDetector instance
+    """
+    return PlateDetector(
+        model_path=model_path,
+        confidence_threshold=confidence_threshold,
+        ocr_languages=list(ocr_languages),
+        device=device
+    )
 
 
 # Utility functions
 
+# Every plate character is ASCII, so after dropping non-ASCII on encode the
+# filter is a bytes.translate over this 256-entry delete table
+_PLATE_CHARS = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -'
+_NON_PLATE_BYTES = bytes(b for b in range(256) if b not in _PLATE_CHARS)
+
+# Indian plate grammar: state code, RTO district, series, number
+# (e.g. KA-01-AB-1234, MH12DE1433, DL 1C 1234)
+_IN_PLATE_RE = re.compile(r'[A-Z]{2}[-\s]?\d{1,2}[-\s]?[A-Z]{1,3}[-\s]?\d{1,4}')
+
+
 def clean_plate_text(text: str) -> str:
     """
     Clean and normalize extracted plate text
@@ -321,15 +912,15 @@ def clean_plate_text(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Remove extra spaces
-    text = ' '.join(text.split())
-    
-    # Convert to uppercase
-    text = text.upper()
+    if PLATE_TEXT_EXT_AVAILABLE:
+        cleaned = _clean_plate_text_ascii(text)
+        if cleaned is not None:
+            return cleaned
     
-    # Remove special characters except common ones in plates
-    allowed_chars = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -')
-    text = ''.join(c for c in text if c in allowed_chars)
+    # Remove extra spaces, convert to uppercase and remove special
+    # characters except common ones in plates
+    text = ' '.join(text.split()).upper().encode('ascii', 'ignore')
+    text = text.translate(None, _NON_PLATE_BYTES).decode('ascii')
     
     return text.strip()
 
@@ -345,18 +936,16 @@ def validate_plate_format(text: str, country: str = 'IN') -> bool:
     Returns:
         True if valid format, False otherwise
     """
+    if country == 'IN' and PLATE_TEXT_EXT_AVAILABLE:
+        valid = _validate_plate_format_in_ascii(text)
+        if valid is not None:
+            return valid
+    
     text = text.strip()
     
     if country == 'IN':
         # Indian plate format: XX-12-AB-1234 or similar variations
-        # Should contain digits and letters
-        if len(text) < 8:
-            return False
-        
-        has_digits = any(c.isdigit() for c in text)
-        has_letters = any(c.isalpha() for c in text)
-        
-        return has_digits and has_letters
+        return _IN_PLATE_RE.fullmatch(text.upper()) is not None
     
     return len(text) > 0
 
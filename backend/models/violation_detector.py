@@ -4,9 +4,12 @@ Detects traffic violations including helmet, seat belt, and tripling violations
 using computer vision and vehicle detection techniques.
 """
 
+import functools
+from collections import deque
 from enum import Enum
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Deque, Iterator, List, Dict, Tuple, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
@@ -18,15 +21,16 @@ class ViolationType(Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ViolationDetection:
-    """Data class for violation detection results"""
+    """Data class for violation detection results (immutable, slotted)"""
     violation_type: ViolationType
     confidence: float
     location: Tuple[int, int, int, int]  # (x1, y1, x2, y2) bounding box
     timestamp: datetime
     vehicle_id: Optional[str] = None
-    additional_info: Optional[Dict] = None
+    # Excluded from the hash: dicts are unhashable
+    additional_info: Optional[Dict] = field(default=None, hash=False)
 
 
 class ViolationDetector:
@@ -35,15 +39,110 @@ class ViolationDetector:
     Specifically targets helmet, seat belt, and tripling violations.
     """
 
-    def __init__(self, confidence_threshold: float = 0.6):
+    # Read-only lookup tables shared by all instances
+    _SEVERITY_MAP = MappingProxyType({
+        ViolationType.HELMET_NOT_WORN: "critical",
+        ViolationType.SEAT_BELT_NOT_WORN: "high",
+        ViolationType.TRIPLING: "critical",
+        ViolationType.NONE: "none"
+    })
+
+    _FINE_MAP = MappingProxyType({
+        ViolationType.HELMET_NOT_WORN: 500,
+        ViolationType.SEAT_BELT_NOT_WORN: 1000,
+        ViolationType.TRIPLING: 500,
+        ViolationType.NONE: 0
+    })
+
+    def __init__(self, confidence_threshold: float = 0.6, history_size: int = 10000):
         """
         Initialize the violation detector.
         
         Args:
             confidence_threshold: Minimum confidence score for violation detection (0-1)
+            history_size: Maximum number of detections kept in history; the
+                oldest are dropped first
         """
         self.confidence_threshold = confidence_threshold
-        self.violation_history: List[ViolationDetection] = []
+        self.violation_history: Deque[ViolationDetection] = deque(maxlen=history_size)
+
+    @staticmethod
+    def _crop_region(frame: any, vehicle_region: Tuple[int, int, int, int]) -> any:
+        """
+        Cut the vehicle region out of a frame.
+        
+        Args:
+            frame: Image frame or video frame to analyze
+            vehicle_region: Bounding box of vehicle region (x1, y1, x2, y2)
+            
+        Returns:
+            Cropped region (a view for numpy frames), or the frame itself if None
+        """
+        if frame is None:
+            return frame
+        x1, y1, x2, y2 = vehicle_region
+        return frame[y1:y2, x1:x2]
+
+    def _run_violation_model(self, crop: any) -> Dict[ViolationType, Tuple[float, Optional[Dict]]]:
+        """
+        Run the multi-class violation model once over a vehicle crop.
+        
+        A single forward pass covers all violation heads, so checking every
+        violation type costs one model call per vehicle region.
+        
+        Args:
+            crop: Vehicle region cut from the frame
+            
+        Returns:
+            Mapping of violation type to (confidence, additional_info)
+        """
+        # Implementation would use one deep learning model with helmet,
+        # seat belt and occupant-count (pose/person detection) heads
+        return {
+            ViolationType.HELMET_NOT_WORN: (0.0, None),
+            ViolationType.SEAT_BELT_NOT_WORN: (0.0, None),
+            ViolationType.TRIPLING: (0.0, {"occupant_count": 0}),
+        }
+
+    def _build_violation(
+        self,
+        violation_type: ViolationType,
+        scores: Dict[ViolationType, Tuple[float, Optional[Dict]]],
+        vehicle_region: Tuple[int, int, int, int],
+        timestamp: datetime
+    ) -> Optional[ViolationDetection]:
+        """
+        Build a ViolationDetection from model scores if it passes the threshold.
+        
+        Args:
+            violation_type: Violation to report
+            scores: Output of _run_violation_model()
+            vehicle_region: Bounding box of vehicle region (x1, y1, x2, y2)
+            timestamp: Detection time
+            
+        Returns:
+            ViolationDetection object if violation detected, None otherwise
+        """
+        confidence, additional_info = scores[violation_type]
+        if confidence < self.confidence_threshold:
+            return None
+        return ViolationDetection(
+            violation_type=violation_type,
+            confidence=confidence,
+            location=vehicle_region,
+            timestamp=timestamp,
+            additional_info=additional_info
+        )
+
+    def _detect_single(
+        self,
+        violation_type: ViolationType,
+        frame: any,
+        vehicle_region: Tuple[int, int, int, int]
+    ) -> Optional[ViolationDetection]:
+        """Run the violation model on a region and report one violation type"""
+        scores = self._run_violation_model(self._crop_region(frame, vehicle_region))
+        return self._build_violation(violation_type, scores, vehicle_region, datetime.utcnow())
 
     def detect_helmet_violation(
         self,
@@ -60,15 +159,7 @@ class ViolationDetector:
         Returns:
             ViolationDetection object if violation detected, None otherwise
         """
-        # Implementation would use deep learning model
-        # to detect head/face and helmet presence
-        violation = ViolationDetection(
-            violation_type=ViolationType.HELMET_NOT_WORN,
-            confidence=0.0,
-            location=vehicle_region,
-            timestamp=datetime.utcnow()
-        )
-        return violation if violation.confidence >= self.confidence_threshold else None
+        return self._detect_single(ViolationType.HELMET_NOT_WORN, frame, vehicle_region)
 
     def detect_seat_belt_violation(
         self,
@@ -85,15 +176,7 @@ class ViolationDetector:
         Returns:
             ViolationDetection object if violation detected, None otherwise
         """
-        # Implementation would use deep learning model
-        # to detect seat belt presence across occupants
-        violation = ViolationDetection(
-            violation_type=ViolationType.SEAT_BELT_NOT_WORN,
-            confidence=0.0,
-            location=vehicle_region,
-            timestamp=datetime.utcnow()
-        )
-        return violation if violation.confidence >= self.confidence_threshold else None
+        return self._detect_single(ViolationType.SEAT_BELT_NOT_WORN, frame, vehicle_region)
 
     def detect_tripling_violation(
         self,
@@ -110,16 +193,7 @@ class ViolationDetector:
         Returns:
             ViolationDetection object if violation detected, None otherwise
         """
-        # Implementation would use pose detection and person detection
-        # to count occupants in a two-wheeler
-        violation = ViolationDetection(
-            violation_type=ViolationType.TRIPLING,
-            confidence=0.0,
-            location=vehicle_region,
-            timestamp=datetime.utcnow(),
-            additional_info={"occupant_count": 0}
-        )
-        return violation if violation.confidence >= self.confidence_threshold else None
+        return self._detect_single(ViolationType.TRIPLING, frame, vehicle_region)
 
     def detect_all_violations(
         self,
@@ -138,17 +212,18 @@ class ViolationDetector:
         """
         violations = []
 
-        helmet_violation = self.detect_helmet_violation(frame, vehicle_region)
-        if helmet_violation:
-            violations.append(helmet_violation)
+        # Crop once and run the model once for all violation types
+        scores = self._run_violation_model(self._crop_region(frame, vehicle_region))
+        timestamp = datetime.utcnow()
 
-        seat_belt_violation = self.detect_seat_belt_violation(frame, vehicle_region)
-        if seat_belt_violation:
-            violations.append(seat_belt_violation)
-
-        tripling_violation = self.detect_tripling_violation(frame, vehicle_region)
-        if tripling_violation:
-            violations.append(tripling_violation)
+        for violation_type in (
+            ViolationType.HELMET_NOT_WORN,
+            ViolationType.SEAT_BELT_NOT_WORN,
+            ViolationType.TRIPLING
+        ):
+            violation = self._build_violation(violation_type, scores, vehicle_region, timestamp)
+            if violation:
+                violations.append(violation)
 
         # Log violations to history
         self.violation_history.extend(violations)
@@ -165,13 +240,7 @@ class ViolationDetector:
         Returns:
             Severity level: "critical", "high", "medium", "low"
         """
-        severity_map = {
-            ViolationType.HELMET_NOT_WORN: "critical",
-            ViolationType.SEAT_BELT_NOT_WORN: "high",
-            ViolationType.TRIPLING: "critical",
-            ViolationType.NONE: "none"
-        }
-        return severity_map.get(violation.violation_type, "low")
+        return self._SEVERITY_MAP.get(violation.violation_type, "low")
 
     def get_violation_fine(self, violation: ViolationType) -> int:
         """
@@ -183,13 +252,7 @@ class ViolationDetector:
         Returns:
             Fine amount in rupees
         """
-        fine_map = {
-            ViolationType.HELMET_NOT_WORN: 500,
-            ViolationType.SEAT_BELT_NOT_WORN: 1000,
-            ViolationType.TRIPLING: 500,
-            ViolationType.NONE: 0
-        }
-        return fine_map.get(violation, 0)
+        return self._FINE_MAP.get(violation, 0)
 
     def clear_history(self) -> None:
         """Clear violation history"""
@@ -200,9 +263,20 @@ class ViolationDetector:
         Get violation detection history.
         
         Returns:
-            List of all detected violations
+            List of the most recent detected violations (a snapshot copy)
+        """
+        return list(self.violation_history)
+
+    def iter_history(self) -> Iterator[ViolationDetection]:
+        """
+        Iterate over violation detection history without copying it.
+        
+        The history must not be modified while iterating.
+        
+        Returns:
+            Iterator over the most recent detected violations, oldest first
         """
-        return self.violation_history.copy()
+        return iter(self.violation_history)
 
     def set_confidence_threshold(self, threshold: float) -> None:
         """
@@ -217,3 +291,25 @@ class ViolationDetector:
         if not 0 <= threshold <= 1:
             raise ValueError("Confidence threshold must be between 0 and 1")
         self.confidence_threshold = threshold
+
+
+@functools.lru_cache(maxsize=4)
+def get_violation_detector(
+    confidence_threshold: float = 0.6,
+    history_size: int = 10000
+) -> ViolationDetector:
+    """
+    Get a shared ViolationDetector for the given confidence threshold.
+    
+    Callers should use this factory instead of constructing a detector per
+    request. The instance (including its violation history) is shared, so
+    use set_confidence_threshold() on it with care.
+    
+    Args:
+        confidence_threshold: Minimum confidence score for violation detection (0-1)
+        history_size: Maximum number of detections kept in history
+        
+    Returns:
+        Cached ViolationDetector instance
+    """
+    return ViolationDetector(confidence_threshold=confidence_threshold, history_size=history_size)
@@ -0,0 +1,93 @@
+"""
+Tests for the PDF generator
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+pdf_generator = pytest.importorskip('pdf_generator')
+
+CHALLAN = {
+    'challan_number': 'CH-20240101-0001',
+    'date': '2024-01-01',
+    'vehicle_number': 'KA01AB1234',
+    'owner_name': 'Test Owner',
+    'violation_description': 'Riding without helmet',
+    'amount': 500,
+    'location': 'MG Road',
+}
+
+
+@pytest.mark.parametrize('extra', [
+    {'notes': 'Pay within 30 days. ' * 1500},
+    {'remarks': '\n'.join(f'Remark {n}' for n in range(44)), 'notes': 'Pay within 30 days.'},
+], ids=['long-notes', 'long-remarks'])
+def test_multi_page_challan_builds_twice(extra):
+    """Shared headings, labels and spacers can be pushed to a new page in every build."""
+    generator = pdf_generator.PDFGenerator()
+    data = {**CHALLAN, **extra}
+
+    first = generator.generate_challan_pdf(data)
+    second = generator.generate_challan_pdf(data)
+
+    assert first.startswith(b'%PDF')
+    assert second.startswith(b'%PDF')
+
+
+def test_concurrent_builds_from_threads():
+    """Documents built at the same time in several threads don't share flowables."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda _: pdf_generator.generate_challan(CHALLAN), range(400)
+        ))
+
+    assert all(pdf.startswith(b'%PDF') for pdf in results)
+
+
+def test_threads_sharing_a_generator_match_serial_output(monkeypatch):
+    """Pooled per-thread templates produce the same bytes as a serial build."""
+    from reportlab import rl_config
+    # Fixed document IDs and dates, so identical input gives identical bytes
+    monkeypatch.setattr(rl_config, 'invariant', 1)
+
+    generator = pdf_generator.PDFGenerator()
+    long_notes = {**CHALLAN, 'notes': 'Pay within 30 days. ' * 1500}
+    expected = [generator.generate_challan_pdf(CHALLAN), generator.generate_challan_pdf(long_notes)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(
+            lambda n: generator.generate_challan_pdf(long_notes if n % 2 else CHALLAN), range(40)
+        ))
+
+    assert results == expected * 20
+
+
+def test_subclass_colors_apply_after_base_styles_are_cached():
+    """Style caches are per class, so overridden colors reach the subclass."""
+    from reportlab.lib.colors import HexColor
+
+    class RedGenerator(pdf_generator.PDFGenerator):
+        HEADER_COLOR = HexColor("#aa0000")
+        TABLE_HEADER_COLOR = HexColor("#550000")
+
+    base = pdf_generator.PDFGenerator()
+    red = RedGenerator()
+
+    assert red.styles['SectionHeading'].textColor == RedGenerator.HEADER_COLOR
+    assert ('BACKGROUND', (0, 0), (0, -1), RedGenerator.TABLE_HEADER_COLOR) in red._table_style.getCommands()
+    assert base.styles['SectionHeading'].textColor == pdf_generator.PDFGenerator.HEADER_COLOR
+    assert ('BACKGROUND', (0, 0), (0, -1), pdf_generator.PDFGenerator.TABLE_HEADER_COLOR) in base._table_style.getCommands()
+
+
+def test_cached_validation_distinguishes_value_types():
+    """Equal values of different types are not served each other's cached result."""
+    validate = pdf_generator.PDFGenerator.validate_challan_data
+
+    assert validate({**CHALLAN, 'amount': 500}) == (True, [])
+    assert validate({**CHALLAN, 'amount': Decimal('500')}) == (False, ['Amount must be a number'])
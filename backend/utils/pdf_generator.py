@@ -6,9 +6,15 @@ with customizable formatting, styling, and data embedding.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 from io import BytesIO
-import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import os
+import threading
+import time
+
+import numpy as np
 
 try:
     from reportlab.lib.pagesizes import letter, A4
@@ -16,8 +22,8 @@ try:
     from reportlab.lib.units import inch, cm
     from reportlab.lib.colors import HexColor, black, white, grey
     from reportlab.platypus import (
-        SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer,
-        PageBreak, Image, KeepTogether
+        BaseDocTemplate, SimpleDocTemplate, Frame, PageTemplate, Table,
+        TableStyle, Paragraph, Spacer, PageBreak, Image, KeepTogether
     )
     from reportlab.pdfgen import canvas
     from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
@@ -25,6 +31,332 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
+try:
+    from PIL import Image as PILImage
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _box_downsample_2x_numpy(pixels: np.ndarray) -> np.ndarray:
+    """
+    Halve an image by averaging each 2x2 pixel block (numpy fallback).
+    
+    Args:
+        pixels: uint8 array of shape (H, W, C)
+        
+    Returns:
+        uint8 array of shape (H // 2, W // 2, C)
+    """
+    h, w = pixels.shape[0] // 2, pixels.shape[1] // 2
+    blocks = pixels[:2 * h, :2 * w].reshape(h, 2, w, 2, -1).astype(np.uint16)
+    return ((blocks.sum(axis=(1, 3)) + 2) // 4).astype(np.uint8)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, nogil=True, parallel=True)
+    def _box_downsample_2x(pixels):
+        """Halve an image by averaging each 2x2 pixel block (rows in parallel)."""
+        h = pixels.shape[0] // 2
+        w = pixels.shape[1] // 2
+        c = pixels.shape[2]
+        out = np.empty((h, w, c), dtype=np.uint8)
+        for y in numba.prange(h):
+            for x in range(w):
+                for k in range(c):
+                    total = (int(pixels[2 * y, 2 * x, k]) + int(pixels[2 * y, 2 * x + 1, k])
+                             + int(pixels[2 * y + 1, 2 * x, k]) + int(pixels[2 * y + 1, 2 * x + 1, k]))
+                    out[y, x, k] = (total + 2) // 4
+        return out
+else:
+    _box_downsample_2x = _box_downsample_2x_numpy
+
+
+# Required fields and their display labels, in report order
+_CHALLAN_FIELD_LABELS = {
+    'challan_number': 'Challan Number',
+    'date': 'Date',
+    'vehicle_number': 'Vehicle Number',
+    'owner_name': 'Owner Name',
+    'violation_description': 'Violation Description',
+    'amount': 'Amount',
+    'location': 'Location',
+}
+
+_RECEIPT_FIELD_LABELS = {
+    'receipt_number': 'Receipt Number',
+    'challan_number': 'Challan Number',
+    'date': 'Date',
+    'amount': 'Amount',
+    'payment_method': 'Payment Method',
+    'vehicle_number': 'Vehicle Number',
+    'owner_name': 'Owner Name',
+}
+
+_CHALLAN_REQUIRED = frozenset(_CHALLAN_FIELD_LABELS)
+_RECEIPT_REQUIRED = frozenset(_RECEIPT_FIELD_LABELS)
+
+# Amounts must be numeric when present
+_NUMBER = (int, float)
+_AMOUNT_TYPE_CHECKS = (('amount', _NUMBER, "Amount must be a number"),)
+
+# Validation schemas: (field labels, required fields, type checks)
+_SCHEMAS = {
+    'challan': (_CHALLAN_FIELD_LABELS, _CHALLAN_REQUIRED, _AMOUNT_TYPE_CHECKS),
+    'receipt': (_RECEIPT_FIELD_LABELS, _RECEIPT_REQUIRED, _AMOUNT_TYPE_CHECKS),
+}
+
+
+def _validate(kind: str, data: Dict) -> Tuple[bool, List[str]]:
+    """
+    Validate document data against a schema from _SCHEMAS.
+    
+    Args:
+        kind: Schema name ('challan' or 'receipt')
+        data: Document data dictionary
+        
+    Returns:
+        Tuple of (is_valid, error_messages)
+    """
+    labels, required, type_checks = _SCHEMAS[kind]
+    missing = required.difference(k for k, v in data.items() if v)
+    errors = [f"{label} is required" for field, label in labels.items() if field in missing]
+    
+    for field, types, message in type_checks:
+        value = data.get(field)
+        if value and not isinstance(value, types):
+            errors.append(message)
+    
+    return not errors, errors
+
+
+@lru_cache(maxsize=1024)
+def _validate_items(kind: str, items: Tuple) -> Tuple[bool, Tuple[str, ...]]:
+    """Cached _validate keyed on the sorted (field, type, value) triples of the data."""
+    is_valid, errors = _validate(kind, {field: value for field, _, value in items})
+    return is_valid, tuple(errors)
+
+
+def _validate_cached(kind: str, data: Dict) -> Tuple[bool, List[str]]:
+    """
+    Validate document data, reusing the result for identical data.
+    
+    The same dict is typically validated several times per document
+    (create, preview, finalize). Value types are part of the key, since
+    e.g. Decimal('500') equals 500 but fails the amount check. Data with
+    unhashable values (or keys that don't sort) skips the cache.
+    
+    Args:
+        kind: Schema name ('challan' or 'receipt')
+        data: Document data dictionary
+        
+    Returns:
+        Tuple of (is_valid, error_messages)
+    """
+    try:
+        items = tuple((field, type(value), value) for field, value in sorted(data.items()))
+        is_valid, errors = _validate_items(kind, items)
+    except TypeError:
+        return _validate(kind, data)
+    # Callers get their own list so the cached result can't be mutated
+    return is_valid, list(errors)
+
+# Layout dimensions in points, computed once at import
+_SPACE_S = 0.2 * inch
+_SPACE_M = 0.3 * inch
+# Shared as tuples: Table copies column widths before adjusting them
+_COL_WIDTHS = (2.5 * inch, 4 * inch)
+_SIGNATURE_COL_WIDTHS = (2 * inch, 0.5 * inch, 2 * inch)
+
+
+# Last formatted footer timestamp: [epoch second, text]. Receipts generated
+# within the same second share one strftime call.
+_TS_CACHE = [0, '']
+
+
+def _generated_timestamp() -> str:
+    """Return the current local time as 'YYYY-MM-DD HH:MM:SS'."""
+    now = int(time.time())
+    cached = _TS_CACHE
+    if now != cached[0]:
+        cached[:] = [now, datetime.fromtimestamp(now).strftime('%Y-%m-%d %H:%M:%S')]
+    return cached[1]
+
+
+# Table row specs: (label, data key, default, formatted as money)
+_CHALLAN_DETAIL_ROWS = (
+    ('Challan Number', 'challan_number', 'N/A', False),
+    ('Date Issued', 'date', 'N/A', False),
+    ('Location', 'location', 'N/A', False),
+    ('Officer ID', 'officer_id', 'N/A', False),
+)
+
+_VEHICLE_ROWS = (
+    ('Vehicle Number', 'vehicle_number', 'N/A', False),
+    ('Owner Name', 'owner_name', 'N/A', False),
+    ('Contact Number', 'contact_number', 'N/A', False),
+    ('Address', 'address', 'N/A', False),
+)
+
+_VIOLATION_ROWS = (
+    ('Violation Type', 'violation_type', 'N/A', False),
+    ('Description', 'violation_description', 'N/A', False),
+    ('Section', 'section', 'N/A', False),
+    ('Remarks', 'remarks', '', False),
+)
+
+_AMOUNT_ROWS = (
+    ('Base Fine', 'base_fine', 0, True),
+    ('Additional Fine', 'additional_fine', 0, True),
+    ('Total Amount', 'amount', 0, True),
+    ('Due Date', 'due_date', 'N/A', False),
+)
+
+_RECEIPT_DETAIL_ROWS = (
+    ('Receipt Number', 'receipt_number', 'N/A', False),
+    ('Challan Number', 'challan_number', 'N/A', False),
+    ('Date', 'date', 'N/A', False),
+    ('Transaction ID', 'transaction_id', 'N/A', False),
+)
+
+_PAYMENT_ROWS = (
+    ('Vehicle Number', 'vehicle_number', 'N/A', False),
+    ('Owner Name', 'owner_name', 'N/A', False),
+    ('Payment Method', 'payment_method', 'N/A', False),
+    ('Amount Paid', 'amount', 0, True),
+)
+
+_CHALLAN_REFERENCE_ROWS = (
+    ('Original Amount', 'original_amount', 0, True),
+    ('Amount Paid', 'amount', 0, True),
+    ('Remaining Balance', 'balance', 0, True),
+    ('Payment Status', 'status', 'Completed', False),
+)
+
+
+class _SinkWriter:
+    """Minimal binary file object that hands every write to a callable."""
+    
+    def __init__(self, sink: Callable[[bytes], None]):
+        self._sink = sink
+    
+    def write(self, data: bytes) -> int:
+        self._sink(data)
+        return len(data)
+    
+    def flush(self) -> None:
+        pass
+
+
+class _PooledDocTemplate(SimpleDocTemplate):
+    """
+    SimpleDocTemplate that can be reused for many documents.
+    
+    SimpleDocTemplate.build creates and appends a fresh pair of page
+    templates on every call. Here they are created once, and reset() clears
+    the per-build state so the same instance can write the next document.
+    """
+    
+    def __init__(self, filename, **kw):
+        super().__init__(filename, **kw)
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([
+            PageTemplate(id='First', frames=frame, pagesize=self.pagesize),
+            PageTemplate(id='Later', frames=frame, pagesize=self.pagesize),
+        ])
+    
+    def reset(self, filename) -> '_PooledDocTemplate':
+        """
+        Point the template at a new output and clear state left by a build.
+        
+        Args:
+            filename: Path or writable binary file object for the next build
+            
+        Returns:
+            The template itself
+        """
+        self.filename = filename
+        self._nameSpace = dict(doc=self)
+        self._lifetimes = {}
+        self._pageRefs = {}
+        self._indexingFlowables = []
+        self._flowableCount = 0
+        self._curPageFlowableCount = 0
+        self._emptyPages = 0
+        self._leftExtraIndent = 0.0
+        self._rightExtraIndent = 0.0
+        self._topFlowables = []
+        self._pageTopFlowables = []
+        self._frameBGs = []
+        self._hanging = []
+        return self
+    
+    def build(self, flowables) -> None:
+        """Build the document using the page templates made at construction."""
+        try:
+            BaseDocTemplate.build(self, flowables)
+        finally:
+            # Don't keep the finished canvas or its output (a buffer, or a
+            # sink writer holding the response callable) alive in the pool
+            self.canv = None
+            self.filename = None
+
+
+# Per-thread document templates, keyed on (page size, margin). A template is
+# taken out of the pool while it builds, so it is only ever used by one build.
+_DOC_TEMPLATES = threading.local()
+
+
+_RUPEE = "₹"
+
+
+def _compile_table_rows(name: str, rows: Tuple) -> Callable[[Dict], List[List]]:
+    """
+    Generate a function that builds the table cells for a row spec.
+    
+    The rows are unrolled into one list display at import time, so building
+    a table is a single call with no loop over the spec. Amounts are
+    formatted as _RUPEE + str(value), the same text as an f-string.
+    
+    Args:
+        name: Name given to the generated function
+        rows: Row specs of (label, key, default, money)
+        
+    Returns:
+        Function mapping a data dictionary to a list of [label, value] rows
+    """
+    cells = []
+    for label, key, default, money in rows:
+        value = f"get({key!r}, {default!r})"
+        if money:
+            value = f"_RUPEE + str({value})"
+        cells.append(f"        [{label!r}, {value}],")
+    source = "\n".join([
+        f"def {name}(data):",
+        "    get = data.get",
+        "    return [",
+        *cells,
+        "    ]",
+    ])
+    namespace = {'_RUPEE': _RUPEE}
+    exec(compile(source, f"<{name}>", 'exec'), namespace)
+    return namespace[name]
+
+
+_challan_detail_rows = _compile_table_rows('_challan_detail_rows', _CHALLAN_DETAIL_ROWS)
+_vehicle_rows = _compile_table_rows('_vehicle_rows', _VEHICLE_ROWS)
+_violation_rows = _compile_table_rows('_violation_rows', _VIOLATION_ROWS)
+_amount_rows = _compile_table_rows('_amount_rows', _AMOUNT_ROWS)
+_receipt_detail_rows = _compile_table_rows('_receipt_detail_rows', _RECEIPT_DETAIL_ROWS)
+_payment_rows = _compile_table_rows('_payment_rows', _PAYMENT_ROWS)
+_challan_reference_rows = _compile_table_rows('_challan_reference_rows', _CHALLAN_REFERENCE_ROWS)
+
 
 class PDFGenerator:
     """
@@ -43,6 +375,15 @@ class PDFGenerator:
     TABLE_HEADER_COLOR = HexColor("#34495e")
     TABLE_ROW_COLOR = HexColor("#ecf0f1")
     TEXT_COLOR = HexColor("#2c3e50")
+    
+    # Logo display width and the resolution it is embedded at
+    LOGO_WIDTH = 1.0 * inch
+    LOGO_DPI = 150
+
+    # Style sheet and table styles, built on first use for each class (so a
+    # subclass's colors apply) and shared by that class's instances
+    _styles_cache = None
+    _table_styles_cache = None
 
     def __init__(self, title: str = "Vehicle Challan System", logo_path: Optional[str] = None):
         """
@@ -57,186 +398,382 @@ class PDFGenerator:
         
         self.title = title
         self.logo_path = logo_path
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self._logo_png, self._logo_size = self._preprocess_logo(logo_path) if logo_path else (None, None)
+        self.styles = self._setup_custom_styles()
+        self._table_style, self._amount_table_style = self._setup_table_styles()
 
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles for the document."""
-        self.styles.add(ParagraphStyle(
+    @classmethod
+    def _setup_table_styles(cls) -> Tuple[TableStyle, TableStyle]:
+        """
+        Build the table styles from this class's colors.
+        
+        Built once per class and shared by its instances; Table.setStyle
+        only reads them.
+        
+        Returns:
+            Tuple of (section table style, amount table style)
+        """
+        cached = cls.__dict__.get('_table_styles_cache')
+        if cached is not None:
+            return cached
+        
+        table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), cls.TABLE_HEADER_COLOR),
+            ('TEXTCOLOR', (0, 0), (0, -1), white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, cls.TABLE_ROW_COLOR]),
+        ])
+        
+        # The amount section highlights the total row
+        amount_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), cls.TABLE_HEADER_COLOR),
+            ('TEXTCOLOR', (0, 0), (0, -1), white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 2), (0, 2), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('FONTSIZE', (1, 2), (1, 2), 12),
+            ('TEXTCOLOR', (1, 2), (1, 2), cls.ACCENT_COLOR),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, grey),
+            ('BACKGROUND', (0, 2), (-1, 2), cls.TABLE_ROW_COLOR),
+            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [white, cls.TABLE_ROW_COLOR]),
+        ])
+        
+        cls._table_styles_cache = (table_style, amount_table_style)
+        return cls._table_styles_cache
+
+    @classmethod
+    def _setup_custom_styles(cls):
+        """
+        Setup custom paragraph styles for the document.
+        
+        The style sheet is built once per class and shared by its instances.
+        
+        Returns:
+            Shared StyleSheet1 with the custom styles added
+        """
+        cached = cls.__dict__.get('_styles_cache')
+        if cached is not None:
+            return cached
+        
+        styles = getSampleStyleSheet()
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=20,
-            textColor=self.HEADER_COLOR,
+            textColor=cls.HEADER_COLOR,
             spaceAfter=12,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeading',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=14,
-            textColor=self.HEADER_COLOR,
+            textColor=cls.HEADER_COLOR,
             spaceAfter=10,
             spaceBefore=10,
             fontName='Helvetica-Bold'
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='FieldLabel',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
-            textColor=self.TEXT_COLOR,
+            textColor=cls.TEXT_COLOR,
             fontName='Helvetica-Bold',
             spaceAfter=2
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='FieldValue',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
-            textColor=self.TEXT_COLOR,
+            textColor=cls.TEXT_COLOR,
             spaceAfter=8
         ))
+        
+        cls._styles_cache = styles
+        return styles
 
     def generate_challan_pdf(
         self,
         challan_data: Dict,
-        output_path: Optional[str] = None
+        output_path: Optional[Union[str, BinaryIO]] = None,
+        sink: Optional[Callable[[bytes], None]] = None
     ) -> Optional[bytes]:
         """
         Generate a PDF for a traffic challan.
         
         Args:
             challan_data: Dictionary containing challan information
-            output_path: Path to save the PDF (optional, returns bytes if not specified)
+            output_path: Path or writable binary file object to write the PDF
+                to (optional, returns bytes if not specified)
+            sink: Callable the PDF bytes are handed to when the document is
+                saved, e.g. a response stream's write (instead of output_path)
             
         Returns:
-            Bytes of PDF if output_path is None, else None
+            Bytes of PDF if neither output_path nor sink is given, else None
         """
-        required_fields = [
-            'challan_number', 'date', 'vehicle_number', 'owner_name',
-            'violation_description', 'amount', 'location'
-        ]
-        
-        if not all(field in challan_data for field in required_fields):
-            raise ValueError(f"Missing required fields. Required: {required_fields}")
+        self._check_required(challan_data, _CHALLAN_REQUIRED)
+        return self._write_pdf(self._build_challan_story(challan_data), output_path, sink)
 
-        if output_path:
-            doc = SimpleDocTemplate(output_path, pagesize=self.DEFAULT_PAGE_SIZE,
-                                   rightMargin=self.MARGIN, leftMargin=self.MARGIN,
-                                   topMargin=self.MARGIN, bottomMargin=self.MARGIN)
-        else:
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=self.DEFAULT_PAGE_SIZE,
-                                   rightMargin=self.MARGIN, leftMargin=self.MARGIN,
-                                   topMargin=self.MARGIN, bottomMargin=self.MARGIN)
-
-        story = []
-        
-        # Add header
-        story.extend(self._create_challan_header())
-        story.append(Spacer(1, 0.2 * inch))
+    def generate_challan_stream(self, challan_data: Dict) -> BytesIO:
+        """
+        Generate a challan PDF into an in-memory stream.
         
-        # Add challan details section
-        story.extend(self._create_challan_details_section(challan_data))
-        story.append(Spacer(1, 0.2 * inch))
+        Lets callers such as HTTP responses read the document in chunks
+        without first copying it out as bytes.
         
-        # Add vehicle information section
-        story.extend(self._create_vehicle_info_section(challan_data))
-        story.append(Spacer(1, 0.2 * inch))
+        Args:
+            challan_data: Dictionary containing challan information
+            
+        Returns:
+            BytesIO holding the PDF, positioned at the start
+        """
+        self._check_required(challan_data, _CHALLAN_REQUIRED)
+        return self._build_to_buffer(self._build_challan_story(challan_data))
+
+    def generate_challan_batch(
+        self,
+        items: List[Dict],
+        output_dir: str,
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generate many challan PDFs into a directory using worker processes.
         
-        # Add violation details section
-        story.extend(self._create_violation_section(challan_data))
-        story.append(Spacer(1, 0.3 * inch))
+        Each worker builds one generator (styles, logo) at startup and
+        reuses it for every document it renders, writing each PDF straight
+        to its file. Processes are used because ReportLab document building
+        is CPU-bound Python and would not scale across threads.
         
-        # Add amount and notes section
-        story.extend(self._create_amount_section(challan_data))
-        story.append(Spacer(1, 0.3 * inch))
+        Workers instantiate this generator's class (which must be importable
+        by module path) and copy any layout settings overridden on this
+        instance, such as DEFAULT_PAGE_SIZE or MARGIN, so they render the
+        same documents as this process.
         
-        # Add signature section
-        story.extend(self._create_signature_section())
+        Args:
+            items: Challan data dictionaries
+            output_dir: Directory to write challan_<n>.pdf files to
+            max_workers: Number of worker processes (default: CPU count);
+                1 renders in this process with this generator
+            
+        Returns:
+            Paths of the generated PDFs, in items order
+        """
+        for challan_data in items:
+            self._check_required(challan_data, _CHALLAN_REQUIRED)
+        os.makedirs(output_dir, exist_ok=True)
         
-        # Build PDF
-        doc.build(story)
+        jobs = [
+            (challan_data, os.path.join(output_dir, f"challan_{n}.pdf"))
+            for n, challan_data in enumerate(items)
+        ]
+        if max_workers == 1:
+            return [self._write_challan_file(job, self) for job in jobs]
         
-        if not output_path:
-            buffer.seek(0)
-            return buffer.getvalue()
-        return None
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(type(self), self.title, self.logo_path, self._instance_settings())
+        ) as executor:
+            chunksize = max(1, len(jobs) // ((max_workers or os.cpu_count() or 1) * 4))
+            return list(executor.map(_write_batch_challan, jobs, chunksize=chunksize))
+
+    def _instance_settings(self) -> Dict:
+        """Upper-case class settings overridden on this instance."""
+        return {name: value for name, value in vars(self).items() if name.isupper()}
+
+    @staticmethod
+    def _write_challan_file(job: Tuple[Dict, str], generator: 'PDFGenerator') -> str:
+        """Render one batch job to its output path and return the path."""
+        challan_data, path = job
+        generator._write_pdf(generator._build_challan_story(challan_data), path)
+        return path
 
     def generate_receipt_pdf(
         self,
         receipt_data: Dict,
-        output_path: Optional[str] = None
+        output_path: Optional[Union[str, BinaryIO]] = None,
+        sink: Optional[Callable[[bytes], None]] = None
     ) -> Optional[bytes]:
         """
         Generate a PDF receipt for challan payment.
         
         Args:
             receipt_data: Dictionary containing receipt information
-            output_path: Path to save the PDF (optional, returns bytes if not specified)
+            output_path: Path or writable binary file object to write the PDF
+                to (optional, returns bytes if not specified)
+            sink: Callable the PDF bytes are handed to when the document is
+                saved, e.g. a response stream's write (instead of output_path)
             
         Returns:
-            Bytes of PDF if output_path is None, else None
+            Bytes of PDF if neither output_path nor sink is given, else None
         """
-        required_fields = [
-            'receipt_number', 'challan_number', 'date', 'amount',
-            'payment_method', 'vehicle_number', 'owner_name'
-        ]
+        self._check_required(receipt_data, _RECEIPT_REQUIRED)
+        return self._write_pdf(self._build_receipt_story(receipt_data), output_path, sink)
+
+    def generate_receipt_stream(self, receipt_data: Dict) -> BytesIO:
+        """
+        Generate a receipt PDF into an in-memory stream.
         
-        if not all(field in receipt_data for field in required_fields):
-            raise ValueError(f"Missing required fields. Required: {required_fields}")
+        Args:
+            receipt_data: Dictionary containing receipt information
+            
+        Returns:
+            BytesIO holding the PDF, positioned at the start
+        """
+        self._check_required(receipt_data, _RECEIPT_REQUIRED)
+        return self._build_to_buffer(self._build_receipt_story(receipt_data))
 
-        if output_path:
-            doc = SimpleDocTemplate(output_path, pagesize=self.DEFAULT_PAGE_SIZE,
-                                   rightMargin=self.MARGIN, leftMargin=self.MARGIN,
-                                   topMargin=self.MARGIN, bottomMargin=self.MARGIN)
+    @staticmethod
+    def _check_required(data: Dict, required: frozenset) -> None:
+        """Raise ValueError if any required field is absent from data."""
+        missing = required.difference(data)
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
+
+    def _build_document(self, story: List, output: Union[str, BinaryIO]) -> None:
+        """Build a story to a path or file object with this thread's pooled template."""
+        pool = getattr(_DOC_TEMPLATES, 'templates', None)
+        if pool is None:
+            pool = _DOC_TEMPLATES.templates = {}
+        key = (self.DEFAULT_PAGE_SIZE, self.MARGIN)
+        doc = pool.pop(key, None)
+        if doc is None:
+            doc = _PooledDocTemplate(output, pagesize=self.DEFAULT_PAGE_SIZE,
+                                     rightMargin=self.MARGIN, leftMargin=self.MARGIN,
+                                     topMargin=self.MARGIN, bottomMargin=self.MARGIN)
         else:
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=self.DEFAULT_PAGE_SIZE,
-                                   rightMargin=self.MARGIN, leftMargin=self.MARGIN,
-                                   topMargin=self.MARGIN, bottomMargin=self.MARGIN)
+            doc.reset(output)
+        doc.build(story)
+        # Only returned after a successful build; a failed one may leave it dirty
+        pool[key] = doc
 
-        story = []
+    def _build_to_buffer(self, story: List) -> BytesIO:
+        """Build a story into a new BytesIO, rewound for reading."""
+        buffer = BytesIO()
+        self._build_document(story, buffer)
+        buffer.seek(0)
+        return buffer
+
+    def _write_pdf(
+        self,
+        story: List,
+        output: Optional[Union[str, BinaryIO]],
+        sink: Optional[Callable[[bytes], None]] = None
+    ) -> Optional[bytes]:
+        """
+        Build a story to the given output.
         
-        # Add receipt header
-        story.extend(self._create_receipt_header())
-        story.append(Spacer(1, 0.2 * inch))
+        Paths, file objects and sinks are written directly; only when none
+        is given is the PDF built in memory and returned as bytes.
         
-        # Add receipt details
-        story.extend(self._create_receipt_details_section(receipt_data))
-        story.append(Spacer(1, 0.2 * inch))
+        Args:
+            story: Flowables making up the document
+            output: Path or writable binary file object, or None
+            sink: Callable receiving written PDF bytes, or None
+            
+        Returns:
+            Bytes of PDF if neither output nor sink is given, else None
+        """
+        if sink is not None:
+            if output:
+                raise ValueError("Pass either output_path or sink, not both")
+            output = _SinkWriter(sink)
+        if not output:
+            return self._build_to_buffer(story).getvalue()
+        self._build_document(story, output)
+        return None
+
+    def _build_challan_story(self, challan_data: Dict) -> List:
+        """Assemble the flowables for a challan document."""
+        return [
+            *self._create_challan_header(),
+            Spacer(1, _SPACE_S),
+            *self._create_challan_details_section(challan_data),
+            Spacer(1, _SPACE_S),
+            *self._create_vehicle_info_section(challan_data),
+            Spacer(1, _SPACE_S),
+            *self._create_violation_section(challan_data),
+            Spacer(1, _SPACE_M),
+            *self._create_amount_section(challan_data),
+            Spacer(1, _SPACE_M),
+            *self._create_signature_section(),
+        ]
+
+    def _build_receipt_story(self, receipt_data: Dict) -> List:
+        """Assemble the flowables for a receipt document."""
+        return [
+            *self._create_receipt_header(),
+            Spacer(1, _SPACE_S),
+            *self._create_receipt_details_section(receipt_data),
+            Spacer(1, _SPACE_S),
+            *self._create_payment_info_section(receipt_data),
+            Spacer(1, _SPACE_S),
+            *self._create_challan_reference_section(receipt_data),
+            Spacer(1, _SPACE_M),
+            *self._create_receipt_footer(),
+        ]
+
+    def _preprocess_logo(self, path: str) -> Tuple[bytes, Tuple[int, int]]:
+        """
+        Downsample the logo to LOGO_DPI at LOGO_WIDTH and encode it as PNG.
         
-        # Add payment information
-        story.extend(self._create_payment_info_section(receipt_data))
-        story.append(Spacer(1, 0.2 * inch))
+        Done once per generator, so every document embeds the same small
+        image instead of the full-resolution original.
         
-        # Add challan reference
-        story.extend(self._create_challan_reference_section(receipt_data))
-        story.append(Spacer(1, 0.3 * inch))
+        Args:
+            path: Path to the logo image file
+            
+        Returns:
+            Tuple of (PNG bytes, (width, height) in pixels)
+        """
+        if not PIL_AVAILABLE:
+            raise ImportError("Pillow library is required for logos. Install it with: pip install Pillow")
         
-        # Add footer
-        story.extend(self._create_receipt_footer())
+        with PILImage.open(path) as image:
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            pixels = np.asarray(image.convert('RGBA' if has_alpha else 'RGB'))
         
-        # Build PDF
-        doc.build(story)
+        target_width = int(self.LOGO_WIDTH / inch * self.LOGO_DPI)
+        while pixels.shape[1] >= 2 * target_width and pixels.shape[0] >= 2:
+            pixels = _box_downsample_2x(np.ascontiguousarray(pixels))
         
-        if not output_path:
-            buffer.seek(0)
-            return buffer.getvalue()
-        return None
+        buffer = BytesIO()
+        PILImage.fromarray(pixels).save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue(), (pixels.shape[1], pixels.shape[0])
+
+    def _create_logo(self) -> List:
+        """Create the logo flowable if a logo was configured."""
+        if self._logo_png is None:
+            return []
+        width, height = self._logo_size
+        return [Image(BytesIO(self._logo_png), width=self.LOGO_WIDTH,
+                      height=self.LOGO_WIDTH * height / width, mask='auto')]
 
     def _create_challan_header(self) -> List:
         """Create header section for challan."""
-        return [
+        return self._create_logo() + [
             Paragraph(self.title.upper(), self.styles['CustomTitle']),
             Paragraph("TRAFFIC VIOLATION CHALLAN", self.styles['SectionHeading']),
         ]
 
     def _create_receipt_header(self) -> List:
         """Create header section for receipt."""
-        return [
+        return self._create_logo() + [
             Paragraph(self.title.upper(), self.styles['CustomTitle']),
             Paragraph("PAYMENT RECEIPT", self.styles['SectionHeading']),
         ]
@@ -245,15 +782,10 @@ class PDFGenerator:
         """Create challan details section."""
         elements = [Paragraph("Challan Details", self.styles['SectionHeading'])]
         
-        details_data = [
-            ['Challan Number', data.get('challan_number', 'N/A')],
-            ['Date Issued', data.get('date', 'N/A')],
-            ['Location', data.get('location', 'N/A')],
-            ['Officer ID', data.get('officer_id', 'N/A')],
-        ]
+        details_data = _challan_detail_rows(data)
         
-        table = Table(details_data, colWidths=[2.5*inch, 4*inch])
-        table.setStyle(self._get_table_style())
+        table = Table(details_data, colWidths=_COL_WIDTHS)
+        table.setStyle(self._table_style)
         elements.append(table)
         
         return elements
@@ -262,15 +794,10 @@ class PDFGenerator:
         """Create vehicle information section."""
         elements = [Paragraph("Vehicle Information", self.styles['SectionHeading'])]
         
-        vehicle_data = [
-            ['Vehicle Number', data.get('vehicle_number', 'N/A')],
-            ['Owner Name', data.get('owner_name', 'N/A')],
-            ['Contact Number', data.get('contact_number', 'N/A')],
-            ['Address', data.get('address', 'N/A')],
-        ]
+        vehicle_data = _vehicle_rows(data)
         
-        table = Table(vehicle_data, colWidths=[2.5*inch, 4*inch])
-        table.setStyle(self._get_table_style())
+        table = Table(vehicle_data, colWidths=_COL_WIDTHS)
+        table.setStyle(self._table_style)
         elements.append(table)
         
         return elements
@@ -279,15 +806,10 @@ class PDFGenerator:
         """Create violation details section."""
         elements = [Paragraph("Violation Details", self.styles['SectionHeading'])]
         
-        violation_data = [
-            ['Violation Type', data.get('violation_type', 'N/A')],
-            ['Description', data.get('violation_description', 'N/A')],
-            ['Section', data.get('section', 'N/A')],
-            ['Remarks', data.get('remarks', '')],
-        ]
+        violation_data = _violation_rows(data)
         
-        table = Table(violation_data, colWidths=[2.5*inch, 4*inch])
-        table.setStyle(self._get_table_style())
+        table = Table(violation_data, colWidths=_COL_WIDTHS)
+        table.setStyle(self._table_style)
         elements.append(table)
         
         return elements
@@ -296,21 +818,19 @@ class PDFGenerator:
         """Create amount and total section."""
         elements = [Paragraph("Amount Due", self.styles['SectionHeading'])]
         
-        amount_data = [
-            ['Base Fine', f"₹{data.get('base_fine', 0)}"],
-            ['Additional Fine', f"₹{data.get('additional_fine', 0)}"],
-            ['Total Amount', f"₹{data.get('amount', 0)}"],
-            ['Due Date', data.get('due_date', 'N/A')],
-        ]
+        amount_data = _amount_rows(data)
         
-        table = Table(amount_data, colWidths=[2.5*inch, 4*inch])
-        table.setStyle(self._get_amount_table_style())
+        table = Table(amount_data, colWidths=_COL_WIDTHS)
+        table.setStyle(self._amount_table_style)
         elements.append(table)
         
-        if data.get('notes'):
-            elements.append(Spacer(1, 0.2 * inch))
-            elements.append(Paragraph("Notes:", self.styles['FieldLabel']))
-            elements.append(Paragraph(data.get('notes', ''), self.styles['FieldValue']))
+        notes = data.get('notes')
+        if notes:
+            elements += (
+                Spacer(1, _SPACE_S),
+                Paragraph("Notes:", self.styles['FieldLabel']),
+                Paragraph(notes, self.styles['FieldValue']),
+            )
         
         return elements
 
@@ -318,15 +838,10 @@ class PDFGenerator:
         """Create receipt details section."""
         elements = [Paragraph("Receipt Information", self.styles['SectionHeading'])]
         
-        details_data = [
-            ['Receipt Number', data.get('receipt_number', 'N/A')],
-            ['Challan Number', data.get('challan_number', 'N/A')],
-            ['Date', data.get('date', 'N/A')],
-            ['Transaction ID', data.get('transaction_id', 'N/A')],
-        ]
+        details_data = _receipt_detail_rows(data)
         
-        table = Table(details_data, colWidths=[2.5*inch, 4*inch])
-        table.setStyle(self._get_table_style())
+        table = Table(details_data, colWidths=_COL_WIDTHS)
+        table.setStyle(self._table_style)
         elements.append(table)
         
         return elements
@@ -335,15 +850,10 @@ class PDFGenerator:
         """Create payment information section."""
         elements = [Paragraph("Payment Information", self.styles['SectionHeading'])]
         
-        payment_data = [
-            ['Vehicle Number', data.get('vehicle_number', 'N/A')],
-            ['Owner Name', data.get('owner_name', 'N/A')],
-            ['Payment Method', data.get('payment_method', 'N/A')],
-            ['Amount Paid', f"₹{data.get('amount', 0)}"],
-        ]
+        payment_data = _payment_rows(data)
         
-        table = Table(payment_data, colWidths=[2.5*inch, 4*inch])
-        table.setStyle(self._get_table_style())
+        table = Table(payment_data, colWidths=_COL_WIDTHS)
+        table.setStyle(self._table_style)
         elements.append(table)
         
         return elements
@@ -352,22 +862,17 @@ class PDFGenerator:
         """Create challan reference section in receipt."""
         elements = [Paragraph("Challan Reference", self.styles['SectionHeading'])]
         
-        reference_data = [
-            ['Original Amount', f"₹{data.get('original_amount', 0)}"],
-            ['Amount Paid', f"₹{data.get('amount', 0)}"],
-            ['Remaining Balance', f"₹{data.get('balance', 0)}"],
-            ['Payment Status', data.get('status', 'Completed')],
-        ]
+        reference_data = _challan_reference_rows(data)
         
-        table = Table(reference_data, colWidths=[2.5*inch, 4*inch])
-        table.setStyle(self._get_table_style())
+        table = Table(reference_data, colWidths=_COL_WIDTHS)
+        table.setStyle(self._table_style)
         elements.append(table)
         
         return elements
 
     def _create_signature_section(self) -> List:
         """Create signature section for challan."""
-        elements = [Spacer(1, 0.3 * inch)]
+        elements = [Spacer(1, _SPACE_M)]
         
         signature_data = [
             ['Issued By', '', 'Acknowledged By'],
@@ -375,7 +880,7 @@ class PDFGenerator:
             ['Officer Signature', '', 'Owner/Driver Signature'],
         ]
         
-        table = Table(signature_data, colWidths=[2*inch, 0.5*inch, 2*inch])
+        table = Table(signature_data, colWidths=_SIGNATURE_COL_WIDTHS)
         table.setStyle(TableStyle([
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
@@ -388,46 +893,11 @@ class PDFGenerator:
 
     def _create_receipt_footer(self) -> List:
         """Create footer section for receipt."""
-        footer_text = f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Please retain this receipt for your records"
+        footer_text = f"Generated on {_generated_timestamp()} | Please retain this receipt for your records"
         return [
             Paragraph(footer_text, self.styles['Normal']),
         ]
 
-    def _get_table_style(self) -> TableStyle:
-        """Get standard table style."""
-        return TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), self.TABLE_HEADER_COLOR),
-            ('TEXTCOLOR', (0, 0), (0, -1), white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, self.TABLE_ROW_COLOR]),
-        ])
-
-    def _get_amount_table_style(self) -> TableStyle:
-        """Get table style for amount section with highlighting."""
-        return TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), self.TABLE_HEADER_COLOR),
-            ('TEXTCOLOR', (0, 0), (0, -1), white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 2), (0, 2), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('FONTSIZE', (1, 2), (1, 2), 12),
-            ('TEXTCOLOR', (1, 2), (1, 2), self.ACCENT_COLOR),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, grey),
-            ('BACKGROUND', (0, 2), (-1, 2), self.TABLE_ROW_COLOR),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [white, self.TABLE_ROW_COLOR]),
-        ])
-
     @staticmethod
     def validate_challan_data(data: Dict) -> Tuple[bool, List[str]]:
         """
@@ -439,25 +909,7 @@ class PDFGenerator:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
-        required_fields = {
-            'challan_number': 'Challan Number',
-            'date': 'Date',
-            'vehicle_number': 'Vehicle Number',
-            'owner_name': 'Owner Name',
-            'violation_description': 'Violation Description',
-            'amount': 'Amount',
-            'location': 'Location',
-        }
-        
-        for field, label in required_fields.items():
-            if field not in data or not data[field]:
-                errors.append(f"{label} is required")
-        
-        if data.get('amount') and not isinstance(data['amount'], (int, float)):
-            errors.append("Amount must be a number")
-        
-        return len(errors) == 0, errors
+        return _validate_cached('challan', data)
 
     @staticmethod
     def validate_receipt_data(data: Dict) -> Tuple[bool, List[str]]:
@@ -470,35 +922,46 @@ class PDFGenerator:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
-        required_fields = {
-            'receipt_number': 'Receipt Number',
-            'challan_number': 'Challan Number',
-            'date': 'Date',
-            'amount': 'Amount',
-            'payment_method': 'Payment Method',
-            'vehicle_number': 'Vehicle Number',
-            'owner_name': 'Owner Name',
-        }
-        
-        for field, label in required_fields.items():
-            if field not in data or not data[field]:
-                errors.append(f"{label} is required")
-        
-        if data.get('amount') and not isinstance(data['amount'], (int, float)):
-            errors.append("Amount must be a number")
-        
-        return len(errors) == 0, errors
+        return _validate_cached('receipt', data)
+
+
+# Batch worker state: one generator per worker process, built by the
+# ProcessPoolExecutor initializer
+_BATCH_GENERATOR: Optional[PDFGenerator] = None
+
+
+def _init_batch_worker(
+    generator_class: type,
+    title: str,
+    logo_path: Optional[str],
+    settings: Dict
+) -> None:
+    """Build the worker process's generator, matching the batch's caller."""
+    global _BATCH_GENERATOR
+    # Settings go on before __init__ so e.g. an overridden LOGO_DPI also
+    # applies to the logo preprocessing
+    generator = generator_class.__new__(generator_class)
+    vars(generator).update(settings)
+    generator.__init__(title=title, logo_path=logo_path)
+    _BATCH_GENERATOR = generator
+
+
+def _write_batch_challan(job: Tuple[Dict, str]) -> str:
+    """Render one challan in a worker process."""
+    return PDFGenerator._write_challan_file(job, _BATCH_GENERATOR)
 
 
 # Convenience functions
-def generate_challan(challan_data: Dict, output_path: Optional[str] = None) -> Optional[bytes]:
+def generate_challan(
+    challan_data: Dict,
+    output_path: Optional[Union[str, BinaryIO]] = None
+) -> Optional[bytes]:
     """
     Generate a challan PDF document.
     
     Args:
         challan_data: Dictionary with challan details
-        output_path: File path to save PDF
+        output_path: File path or writable binary file object to save PDF
         
     Returns:
         PDF bytes if output_path is None, else None
@@ -507,13 +970,16 @@ def generate_challan(challan_data: Dict, output_path: Optional[str] = None) -> O
     return generator.generate_challan_pdf(challan_data, output_path)
 
 
-def generate_receipt(receipt_data: Dict, output_path: Optional[str] = None) -> Optional[bytes]:
+def generate_receipt(
+    receipt_data: Dict,
+    output_path: Optional[Union[str, BinaryIO]] = None
+) -> Optional[bytes]:
     """
     Generate a receipt PDF document.
     
     Args:
         receipt_data: Dictionary with receipt details
-        output_path: File path to save PDF
+        output_path: File path or writable binary file object to save PDF
         
     Returns:
         PDF bytes if output_path is None, else None